@@ -17,9 +17,9 @@ from ..core import (
     Pull,
     Sync
 )
-from ..model import TrackJson, JsonIO, ConfigJson, AttrDict
+from ..model import TrackJson, JsonIO, ConfigJson, AttrDict, LocalModule
 from ..track import LocalTracks, GithubTracks
-from ..utils import Log
+from ..utils import Log, HttpUtils, GitUtils, ZipUtils
 
 
 class SafeArgs(Namespace):
@@ -78,6 +78,20 @@ class Main:
         elif cls._args.cmd == Parameters.CHECK:
             return cls.check()
 
+    @classmethod
+    def _set_cache_folder(cls, config: Config):
+        if cls._args.no_cache:
+            Pull.set_use_cache(False)
+            Check.set_use_cache(False)
+            return
+
+        cache_folder = config.cache_folder
+        HttpUtils.set_cache_folder(cache_folder)
+        GitUtils.set_cache_folder(cache_folder)
+        LocalModule.set_cache_folder(cache_folder)
+        LocalModule.prune_cache()
+        TrackJson.set_cache_folder(cache_folder)
+
     @classmethod
     def config(cls) -> int:
         root_folder = Path(cls._args.root_folder).resolve()
@@ -132,6 +146,10 @@ class Main:
             migrate.track()
             return cls.CODE_SUCCESS
 
+        if not cls._args.no_cache:
+            cache_folder = Config.get_cache_folder(root_folder)
+            TrackJson.set_cache_folder(cache_folder)
+
         if cls._args.list:
             config = Config(root_folder)
             tracks = LocalTracks(modules_folder=modules_folder, config=config)
@@ -140,6 +158,7 @@ class Main:
 
         elif cls._args.track_values is not None:
             _dict, _error = json_parse(cls._args.track_values, TrackJson)
+            _error.update(check_track(_dict))
             if len(_error) != 0:
                 error = json.dumps(obj=_error, indent=2)
                 print_error(error)
@@ -161,11 +180,17 @@ class Main:
 
         elif cls._args.stdin:
             track = TrackJson(json.load(fp=sys.stdin))
-            LocalTracks.add_track(
-                track=track,
-                modules_folder=modules_folder,
-                cover=True
-            )
+            _error = check_track(track)
+            if len(_error) != 0:
+                error = json.dumps(obj=_error, indent=2)
+                print_error(error)
+
+            else:
+                LocalTracks.add_track(
+                    track=track,
+                    modules_folder=modules_folder,
+                    cover=True
+                )
 
         elif cls._args.keys:
             keys = TrackJson.expected_fields(False)
@@ -181,6 +206,7 @@ class Main:
 
             if cls._args.update_track_values is not None:
                 _dict, _error = json_parse(cls._args.update_track_values, TrackJson)
+                _error.update(check_track(_dict))
                 if len(_error) != 0:
                     error = json.dumps(obj=_error, indent=2)
                     print_error(error)
@@ -219,6 +245,8 @@ class Main:
         Pull.set_max_size(cls._args.max_size)
 
         config = Config(root_folder)
+        if not cls._args.no_cache:
+            GithubTracks.set_cache_folder(config.cache_folder)
 
         tracks = GithubTracks(
             modules_folder=modules_folder,
@@ -232,7 +260,9 @@ class Main:
             repo_names=cls._args.repo_names,
             single=cls._args.single,
             cover=cls._args.cover,
-            use_ssh=cls._args.ssh
+            use_ssh=cls._args.ssh,
+            include_forks=cls._args.include_forks,
+            include_archived=cls._args.include_archived
         )
 
         if cls._args.clear:
@@ -245,8 +275,10 @@ class Main:
         root_folder = Path(cls._args.root_folder).resolve()
         Log.set_enable_stdout(not cls._args.quiet)
         Pull.set_max_size(cls._args.max_size)
+        ZipUtils.set_compress_level(cls._args.zip_level)
 
         config = Config(root_folder)
+        cls._set_cache_folder(config)
 
         sync = Sync(root_folder=root_folder, config=config)
         sync.create_local_tracks()
@@ -268,7 +300,13 @@ class Main:
 
         if cls._args.push:
             index = Index(root_folder=root_folder, config=config)
-            index(version=cls._args.index_version, to_file=True)
+            index(
+                version=cls._args.index_version,
+                to_file=True,
+                single=cls._args.single,
+                incremental=cls._args.incremental,
+                module_ids=sync.get_updated_ids()
+            )
             index.push_by_git(cls._args.git_branch)
 
         return cls.CODE_SUCCESS
@@ -279,6 +317,7 @@ class Main:
         Log.set_enable_stdout(False)
 
         config = Config(root_folder)
+        cls._set_cache_folder(config)
 
         index = Index(root_folder=root_folder, config=config)
 
@@ -287,7 +326,12 @@ class Main:
             print(markdown_text)
 
         else:
-            index(version=cls._args.index_version, to_file=not cls._args.json)
+            index(
+                version=cls._args.index_version,
+                to_file=not cls._args.json,
+                single=cls._args.single,
+                incremental=cls._args.incremental
+            )
 
             if cls._args.json:
                 print_json(index.modules_json)
@@ -306,10 +350,14 @@ class Main:
             cls._args.check_id
             or cls._args.check_url
             or cls._args.remove_old
+            or cls._args.check_props
+            or cls._args.verify_file
         ):
             return cls.CODE_FAILURE
 
         config = Config(root_folder)
+        cls._set_cache_folder(config)
+
         check = Check(root_folder=root_folder, config=config)
 
         if cls._args.check_id:
@@ -321,6 +369,22 @@ class Main:
         if cls._args.remove_old:
             check.old(module_ids=cls._args.module_ids)
 
+        if cls._args.check_props:
+            check.props(module_ids=cls._args.module_ids)
+
+        if cls._args.verify_file:
+            report = check.verify(
+                module_ids=cls._args.module_ids,
+                quarantine=cls._args.quarantine
+            )
+
+            if isinstance(cls._args.verify_file, str):
+                verify_file = Path(cls._args.verify_file)
+                verify_file.write_text(json.dumps(report, indent=2))
+
+            else:
+                print_json(report)
+
         return cls.CODE_SUCCESS
 
 
@@ -362,3 +426,13 @@ def json_parse(texts: Sequence[str], __cls: Type) -> Tuple[AttrDict, AttrDict]:
             _error[key] = str(err)
 
     return _dict, _error
+
+
+def check_track(track: AttrDict) -> AttrDict:
+    _error = AttrDict()
+
+    clone_strategy = track.get("clone_strategy")
+    if clone_strategy is not None and clone_strategy not in GitUtils.clone_strategies():
+        _error["clone_strategy"] = f"must be one of {GitUtils.clone_strategies()}"
+
+    return _error
@@ -219,7 +219,7 @@ class Parameters:
             help="Show the track of module."
         )
 
-        cls.add_parser_env(p)
+        cls.add_parser_env(p, add_no_cache=True)
 
     @classmethod
     def configure_parser_github(cls, sub_parsers):
@@ -264,13 +264,25 @@ class Parameters:
             action="store_true",
             help="Overwrite fields of tracks (exclude 'added')."
         )
+        p.add_argument(
+            "--no-forks",
+            dest="include_forks",
+            action="store_false",
+            help="Skip forked repositories."
+        )
+        p.add_argument(
+            "--no-archived",
+            dest="include_archived",
+            action="store_false",
+            help="Skip archived repositories."
+        )
         p.add_argument(
             "--clear",
             action="store_true",
             help="Remove tracks, exclude those in the current session."
         )
 
-        env = cls.add_parser_env(p, add_quiet=True)
+        env = cls.add_parser_env(p, add_quiet=True, add_no_cache=True)
         env.add_argument(
             "--single",
             action="store_true",
@@ -306,6 +318,11 @@ class Parameters:
             default=Index.latest_version,
             help="Version of the index file ({0}), default: {1}.".format(ModulesJson.filename(), "%(default)s")
         )
+        p.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only update changed modules in the index file ({0}).".format(ModulesJson.filename())
+        )
         p.add_argument(
             "--diff",
             dest="diff_file",
@@ -320,12 +337,21 @@ class Parameters:
             help="Remove all old versions of modules."
         )
         cls.add_parser_git(p)
-        env = cls.add_parser_env(p, add_quiet=True)
+        env = cls.add_parser_env(p, add_quiet=True, add_no_cache=True)
         env.add_argument(
             "--single",
             action="store_true",
             help="Run in single-threaded mode."
         )
+        env.add_argument(
+            "--zip-level",
+            dest="zip_level",
+            metavar="LEVEL",
+            type=int,
+            choices=range(10),
+            default=6,
+            help="Compression level of zip files packaged from git, default: {0}.".format("%(default)s")
+        )
 
     @classmethod
     def configure_parser_index(cls, sub_parsers):
@@ -341,6 +367,11 @@ class Parameters:
             default=Index.latest_version,
             help="Version of the index file ({0}), default: {1}.".format(ModulesJson.filename(), "%(default)s")
         )
+        p.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only update changed modules in the index file ({0}).".format(ModulesJson.filename())
+        )
         p.add_argument(
             "--json",
             action="store_true",
@@ -353,7 +384,12 @@ class Parameters:
         )
 
         cls.add_parser_git(p, add_set_size=False)
-        cls.add_parser_env(p)
+        env = cls.add_parser_env(p, add_no_cache=True)
+        env.add_argument(
+            "--single",
+            action="store_true",
+            help="Run in single-threaded mode."
+        )
 
     @classmethod
     def configure_parser_check(cls, sub_parsers):
@@ -390,11 +426,31 @@ class Parameters:
             action="store_true",
             help=f"Remove old versions by max_num."
         )
+        p.add_argument(
+            "-P",
+            "--props",
+            dest="check_props",
+            action="store_true",
+            help=f"Save module.prop of zip files into {UpdateJson.filename()}."
+        )
+        p.add_argument(
+            "--verify",
+            dest="verify_file",
+            metavar="FILE",
+            action=BoolOrStrAction,
+            nargs="?",
+            help="Test CRC of zip files and report corrupted ones (JSON)."
+        )
+        p.add_argument(
+            "--quarantine",
+            action="store_true",
+            help=f"Remove corrupted versions from {UpdateJson.filename()}, use with --verify."
+        )
 
-        cls.add_parser_env(p)
+        cls.add_parser_env(p, add_no_cache=True)
 
     @classmethod
-    def add_parser_env(cls, p, add_quiet=False):
+    def add_parser_env(cls, p, add_quiet=False, add_no_cache=False):
         env = p.add_argument_group("env")
         env.add_argument(
             "-p",
@@ -414,6 +470,14 @@ class Parameters:
                 help="Show only error logs (piped through stderr)."
             )
 
+        if add_no_cache:
+            env.add_argument(
+                "--no-cache",
+                dest="no_cache",
+                action="store_true",
+                help="Do not use caches in the repository (cache/)."
+            )
+
         return env
 
     @classmethod
@@ -1,22 +1,32 @@
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 
 from .Config import Config
 from .Index import Index
 from .Pull import Pull
-from ..model import TrackJson, UpdateJson, VersionItem
+from ..model import AttrDict, TrackJson, UpdateJson, VersionItem
 from ..track import LocalTracks
-from ..utils import Log
+from ..utils import Log, SqliteCache, ZipUtils
 
 
 class Check:
+    _use_cache = True
+
     def __init__(self, root_folder, config):
         self._log = Log("Check", enable_log=config.enable_log, log_dir=config.log_dir)
 
         self._local_folder = Config.get_local_folder(root_folder)
         self._modules_folder = Config.get_modules_folder(root_folder)
+        self._root_folder = root_folder
         self._tracks = LocalTracks(self._modules_folder, config)
         self._config = config
 
+    @property
+    def _cache_folder(self):
+        # created on first use, nothing is written with --no-cache
+        return Config.get_cache_folder(self._root_folder)
+
     def _get_file_url(self, module_id, file):
         func = getattr(Pull, "_get_file_url")
         return func(self, module_id, file)
@@ -27,6 +37,13 @@ class Check:
 
         return self._tracks.tracks
 
+    def _get_update_json(self, track):
+        module = self._tracks.snapshot.get(track.id)
+        if module is None or module.update_json is None:
+            return None, None
+
+        return module.update_json, module.folder.joinpath(UpdateJson.filename())
+
     def _check_folder(self, track, target_id):
         if track.id == target_id:
             return True
@@ -42,32 +59,35 @@ class Check:
             msg = f"{target_id} already exists, move the old to {new_module_folder.as_posix()}"
             self._log.w(f"_check_folder: [{track.id}] -> {msg}")
             shutil.move(old_module_folder, new_module_folder)
+            self._tracks.snapshot.remove(track.id)
 
             return True
 
         old_module_folder.rename(new_module_folder)
+        self._tracks.snapshot.remove(track.id)
+        self._tracks.snapshot.update(target_id)
         track.update(id=target_id)
 
         return False
 
     def _get_new_version_item(self, track, item):
-        module_folder = self._modules_folder.joinpath(track.id)
+        module = self._tracks.snapshot.get(track.id)
 
         zipfile_name = item.zipfile_name
-        zipfile = module_folder.joinpath(zipfile_name)
-        if not zipfile.exists():
+        zipfile = module.folder.joinpath(zipfile_name)
+        if not module.exists(zipfile_name):
             msg = f"{zipfile_name} does not exist, it will be removed from {UpdateJson.filename()}"
             self._log.w(f"_get_new_version_item: [{track.id}] -> {msg}")
             return None
 
         new_zip_url = self._get_file_url(track.id, zipfile)
 
-        changelog = module_folder.joinpath(item.changelog_filename)
+        changelog = module.folder.joinpath(item.changelog_filename)
         new_changelog_url = ""
-        if changelog.exists() and changelog.is_file():
+        if module.exists(changelog.name):
             new_changelog_url = self._get_file_url(track.id, changelog)
 
-        return VersionItem(
+        new_item = VersionItem(
             timestamp=item.timestamp,
             version=item.version,
             versionCode=item.versionCode,
@@ -75,6 +95,11 @@ class Check:
             changelog=new_changelog_url
         )
 
+        if item.prop is not None:
+            new_item.prop = item.prop
+
+        return new_item
+
     def _check_update_json(self, track, update_json, check_id):
         new_update_json = UpdateJson(
             id=track.id,
@@ -107,13 +132,10 @@ class Check:
 
     def url(self, module_ids=None, new=False):
         for track in self._get_tracks(module_ids, new):
-            module_folder = self._modules_folder.joinpath(track.id)
-            update_json_file = module_folder.joinpath(UpdateJson.filename())
-            if not update_json_file.exists():
+            update_json, update_json_file = self._get_update_json(track)
+            if update_json is None:
                 continue
 
-            update_json = UpdateJson.load(update_json_file)
-
             if not self._check_update_json(track, update_json, False):
                 self._log.i(f"url: [{track.id}] -> {UpdateJson.filename()} has been updated")
                 update_json.write(update_json_file)
@@ -121,18 +143,20 @@ class Check:
     def ids(self, module_ids=None, new=False):
         for track in self._get_tracks(module_ids, new):
             old_id = track.id
-            module_folder = self._modules_folder.joinpath(old_id)
+            module = self._tracks.snapshot.get(old_id)
+            if module is None:
+                continue
 
             zip_files = sorted(
-                module_folder.glob("*.zip"),
-                key=lambda f: f.stat().st_mtime,
+                [name for name in module.files.keys() if name.endswith(".zip")],
+                key=lambda name: module.stat(name).st_mtime,
                 reverse=True
             )
 
             if len(zip_files) == 0:
                 continue
 
-            latest_zip = zip_files[0]
+            latest_zip = module.folder.joinpath(zip_files[0])
             online_module = self.get_online_module(track.id, latest_zip)
             if online_module is None:
                 continue
@@ -143,24 +167,164 @@ class Check:
                 track_json_file = module_folder.joinpath(TrackJson.filename())
                 track.write(track_json_file)
 
-            update_json_file = module_folder.joinpath(UpdateJson.filename())
-            if not update_json_file.exists():
+            update_json, update_json_file = self._get_update_json(track)
+            if update_json is None:
                 continue
 
-            update_json = UpdateJson.load(update_json_file)
             if not self._check_update_json(track, update_json, True):
                 self._log.i(f"ids: [{track.id}] -> {UpdateJson.filename()} has been updated")
                 update_json.write(update_json_file)
 
-    def old(self, module_ids=None, new=False):
+    def props(self, module_ids=None, new=False):
+        for track in self._get_tracks(module_ids, new):
+            update_json, update_json_file = self._get_update_json(track)
+            if update_json is None:
+                continue
+
+            module = self._tracks.snapshot.get(track.id)
+            is_updated = False
+
+            for item in update_json.versions:
+                if item.prop is not None:
+                    continue
+
+                zipfile = module.folder.joinpath(item.zipfile_name)
+                if not module.exists(zipfile.name):
+                    continue
+
+                online_module = self.get_online_module(track.id, zipfile)
+                if online_module is None:
+                    continue
+
+                item.prop = AttrDict(online_module)
+                is_updated = True
+
+            if is_updated:
+                self._log.i(f"props: [{track.id}] -> {UpdateJson.filename()} has been updated")
+                update_json.write(update_json_file)
+
+    def _quarantine(self, track, update_json_file, items):
+        module_folder = self._modules_folder.joinpath(track.id)
+        quarantine_folder = self._cache_folder.joinpath("quarantine", track.id)
+        quarantine_folder.mkdir(parents=True, exist_ok=True)
+
+        update_json, _ = self._get_update_json(track)
+        zipfile_names = [item.zipfile_name for item in items]
+        update_json.versions = [
+            item for item in update_json.versions
+            if item.zipfile_name not in zipfile_names
+        ]
+
+        for item in items:
+            zipfile = module_folder.joinpath(item.zipfile_name)
+            changelog = module_folder.joinpath(item.changelog_filename)
+
+            for path in [zipfile, changelog]:
+                if not (path.exists() and path.is_file()):
+                    continue
+
+                self._log.w(f"_quarantine: [{track.id}] -> move {path.name} to {quarantine_folder.as_posix()}")
+                shutil.move(path, quarantine_folder.joinpath(path.name))
+
+        if len(update_json.versions) == 0:
+            self._log.w(f"_quarantine: [{track.id}] -> no version left, remove {UpdateJson.filename()}")
+            update_json_file.unlink()
+        else:
+            self._log.i(f"_quarantine: [{track.id}] -> {UpdateJson.filename()} has been updated")
+            update_json.write(update_json_file)
+
+        track_json_file = module_folder.joinpath(TrackJson.filename())
+        track.versions = len(update_json.versions)
+        track.write(track_json_file)
+        self._tracks.snapshot.update(track.id)
+
+    def verify(self, module_ids=None, new=False, quarantine=False):
+        cache = None
+        if self._use_cache:
+            cache = SqliteCache(self._cache_folder.joinpath("modules.db"), "verified")
+
+        versions = list()
         for track in self._get_tracks(module_ids, new):
-            module_folder = self._modules_folder.joinpath(track.id)
-            update_json_file = module_folder.joinpath(UpdateJson.filename())
-            if not update_json_file.exists():
+            update_json, update_json_file = self._get_update_json(track)
+            if update_json is None:
+                continue
+
+            module = self._tracks.snapshot.get(track.id)
+            for item in update_json.versions:
+                zipfile = module.folder.joinpath(item.zipfile_name)
+                versions.append((track, update_json_file, item, zipfile, module.stat(zipfile.name)))
+
+        errors = dict()
+        pending = list()
+        for index, (*_, zipfile, stat) in enumerate(versions):
+            if stat is None:
+                errors[index] = "file does not exist"
                 continue
 
-            update_json = UpdateJson.load(update_json_file)
+            # skip zip files that have not been changed since the last verification
+            key = zipfile.resolve().as_posix()
+            stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+            if cache is not None and cache.get(key, stamp) is not None:
+                continue
+
+            pending.append((index, key, stamp))
+
+        timestamp = datetime.now().timestamp()
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(
+                ZipUtils.test_archive,
+                [versions[index][3] for index, *_ in pending],
+                chunksize=8
+            )
+
+            for (index, key, stamp), error in zip(pending, results):
+                if error is not None:
+                    errors[index] = error
+                elif cache is not None:
+                    cache.set(key, stamp, dict(timestamp=timestamp))
+
+        report = AttrDict(
+            timestamp=timestamp,
+            total=len(versions),
+            tested=len(pending),
+            corrupted=list()
+        )
+
+        corrupted = dict()
+        for index, error in sorted(errors.items()):
+            track, update_json_file, item, zipfile, _ = versions[index]
+            self._log.e(f"verify: [{track.id}] -> {zipfile.name}: {error}")
+
+            report.corrupted.append(
+                AttrDict(
+                    id=track.id,
+                    version=item.version_display,
+                    file=zipfile.relative_to(self._modules_folder).as_posix(),
+                    error=error
+                )
+            )
+            corrupted.setdefault(track.id, (track, update_json_file, list()))[-1].append(item)
+
+        if cache is not None:
+            cache.close()
+
+        if quarantine:
+            for track, update_json_file, items in corrupted.values():
+                self._quarantine(track, update_json_file, items)
+
+        return report
+
+    @classmethod
+    def set_use_cache(cls, value):
+        cls._use_cache = value
+
+    def old(self, module_ids=None, new=False):
+        for track in self._get_tracks(module_ids, new):
+            update_json, update_json_file = self._get_update_json(track)
+            if update_json is None:
+                continue
 
+            module_folder = update_json_file.parent
             max_num = self._config.max_num
             if track.max_num is not None:
                 max_num = track.max_num
@@ -188,3 +352,4 @@ class Check:
             track_json_file = module_folder.joinpath(TrackJson.filename())
             track.versions = len(update_json.versions)
             track.write(track_json_file)
+            self._tracks.snapshot.update(track.id)
@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from ..model import (
+    AttrDict,
     ConfigJson,
     TrackJson,
     OnlineModule,
@@ -15,18 +16,34 @@ from ..utils import Log
 class Check:
     _log: Log
 
+    _use_cache: bool
+
     _local_folder: Path
     _modules_folder: Path
+    _root_folder: Path
     _config: ConfigJson
     _tracks: LocalTracks
 
     def __init__(self, root_folder: Path, config: ConfigJson): ...
+    @property
+    def _cache_folder(self) -> Path: ...
     def _get_file_url(self, module_id: str, file: Path) -> str: ...
     def _get_tracks(self, module_ids: Optional[List[str]], new: bool) -> List[TrackJson]: ...
+    def _get_update_json(self, track: TrackJson) -> Tuple[Optional[UpdateJson], Optional[Path]]: ...
     def _check_folder(self, track: TrackJson, target_id: str) -> bool: ...
     def _get_new_version_item(self, track: TrackJson, item: VersionItem) -> Optional[VersionItem]: ...
     def _check_update_json(self, track: TrackJson, update_json: UpdateJson, check_id: bool)-> bool: ...
     def get_online_module(self, module_id: str, zip_file: Path) -> Optional[OnlineModule]: ...
     def url(self, module_ids: Optional[List[str]] = ..., new: bool = ...): ...
     def ids(self, module_ids: Optional[List[str]] = ..., new: bool = ...): ...
+    def props(self, module_ids: Optional[List[str]] = ..., new: bool = ...): ...
+    def _quarantine(self, track: TrackJson, update_json_file: Path, items: List[VersionItem]): ...
+    def verify(
+        self,
+        module_ids: Optional[List[str]] = ...,
+        new: bool = ...,
+        quarantine: bool = ...
+    ) -> AttrDict: ...
+    @classmethod
+    def set_use_cache(cls, value: bool): ...
     def old(self, module_ids: Optional[List[str]] = ..., new: bool = ...): ...
@@ -2,7 +2,7 @@ from pathlib import Path
 
 from ..error import ConfigError
 from ..model import ConfigJson, JsonIO
-from ..utils import Log, StrUtils
+from ..utils import Log, StrUtils, GitUtils
 
 
 class Config(ConfigJson):
@@ -46,12 +46,17 @@ class Config(ConfigJson):
             if not log_dir.is_absolute():
                 log_dir = self._root_folder.joinpath(log_dir)
 
+        clone_strategy = self.get("clone_strategy", default.clone_strategy)
+        if clone_strategy not in GitUtils.clone_strategies():
+            raise ConfigError(f"'clone_strategy' must be one of {GitUtils.clone_strategies()}")
+
         self.update(
             name=name,
             base_url=base_url,
             max_num=max_num,
             enable_log=enable_log,
-            log_dir=log_dir
+            log_dir=log_dir,
+            clone_strategy=clone_strategy
         )
 
     @property
@@ -66,6 +71,10 @@ class Config(ConfigJson):
     def local_folder(self):
         return self.get_local_folder(self._root_folder)
 
+    @property
+    def cache_folder(self):
+        return self.get_cache_folder(self._root_folder)
+
     @classmethod
     def get_json_folder(cls, root_folder):
         return root_folder.joinpath("json")
@@ -77,3 +86,15 @@ class Config(ConfigJson):
     @classmethod
     def get_local_folder(cls, root_folder):
         return root_folder.joinpath("local")
+
+    @classmethod
+    def get_cache_folder(cls, root_folder):
+        cache_folder = root_folder.joinpath("cache")
+        gitignore = cache_folder.joinpath(".gitignore")
+
+        # keep caches out of the published repository
+        if not gitignore.exists():
+            cache_folder.mkdir(parents=True, exist_ok=True)
+            gitignore.write_text("*\n")
+
+        return cache_folder
@@ -16,9 +16,13 @@ class Config(ConfigJson):
     def modules_folder(self) -> Path: ...
     @property
     def local_folder(self) -> Path: ...
+    @property
+    def cache_folder(self) -> Path: ...
     @classmethod
     def get_json_folder(cls, root_folder: Path) -> Path: ...
     @classmethod
     def get_modules_folder(cls, root_folder: Path) -> Path: ...
     @classmethod
     def get_local_folder(cls, root_folder: Path) -> Path: ...
+    @classmethod
+    def get_cache_folder(cls, root_folder: Path) -> Path: ...
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from git import Repo
@@ -10,7 +11,8 @@ from ..model import (
     ModulesJson,
     UpdateJson,
     LocalModule,
-    OnlineModule
+    OnlineModule,
+    TrackJson
 )
 from ..track import LocalTracks
 from ..utils import Log
@@ -33,14 +35,31 @@ class Index:
         # noinspection PyTypeChecker
         self.modules_json = None
 
-    def _add_modules_json_0(self, track, update_json, online_module):
-        if self.modules_json is None:
-            self.modules_json = ModulesJson(
-                name=self._config.name,
-                timestamp=datetime.now().timestamp(),
-                modules=list()
-            )
+    def _create_modules_json_0(self):
+        return ModulesJson(
+            name=self._config.name,
+            timestamp=datetime.now().timestamp(),
+            modules=list()
+        )
+
+    def _create_modules_json_1(self):
+        return ModulesJson(
+            name=self._config.name,
+            metadata=AttrDict(
+                version=1,
+                timestamp=datetime.now().timestamp()
+            ),
+            modules=list()
+        )
+
+    def _create_modules_json(self, version):
+        if version not in self.versions:
+            raise RuntimeError(f"unsupported version: {version}")
+
+        func = getattr(self, f"_create_modules_json_{version}")
+        return func()
 
+    def _add_modules_json_0(self, track, update_json, online_module):
         latest_item = update_json.versions[-1]
 
         online_module.license = track.license or ""
@@ -52,18 +71,8 @@ class Index:
         self.modules_json.modules.append(online_module)
 
     def _add_modules_json_1(self, track, update_json, online_module):
-        if self.modules_json is None:
-            self.modules_json = ModulesJson(
-                name=self._config.name,
-                metadata=AttrDict(
-                    version=1,
-                    timestamp=datetime.now().timestamp()
-                ),
-                modules=list()
-            )
-
         online_module.track = track.json()
-        online_module.versions = update_json.versions
+        online_module.versions = [item.without_prop() for item in update_json.versions]
 
         self.modules_json.modules.append(online_module)
 
@@ -93,24 +102,106 @@ class Index:
         else:
             return result.value
 
-    def __call__(self, version, to_file):
-        for track in self._tracks.get_tracks():
-            module_folder = self._modules_folder.joinpath(track.id)
-            update_json_file = module_folder.joinpath(UpdateJson.filename())
-            if not update_json_file.exists():
-                continue
+    def _get_module(self, track):
+        module = self._tracks.snapshot.get(track.id)
+        if module is None or module.update_json is None:
+            return None
+
+        update_json = module.update_json
+        latest_item = update_json.versions[-1]
+
+        zip_file = module.folder.joinpath(latest_item.zipfile_name)
+        if not module.exists(zip_file.name):
+            return None
+
+        online_module = self.get_latest_module(track.id, latest_item, zip_file)
+        if online_module is None:
+            return None
+
+        return track, update_json, online_module
+
+    def _get_last_modules(self, version):
+        json_file = self._json_folder.joinpath(ModulesJson.filename())
+        if not json_file.exists():
+            return dict(), 0.0
+
+        modules_json = ModulesJson.load(json_file)
+        if modules_json.get_version() != version:
+            return dict(), 0.0
+
+        last_modules = {module.id: module for module in modules_json.modules}
+        return last_modules, json_file.stat().st_mtime
+
+    def _is_changed(self, track, last_modified):
+        module = self._tracks.snapshot.get(track.id)
+        for name in [UpdateJson.filename(), TrackJson.filename()]:
+            stat = module.stat(name)
+            if stat is not None and stat.st_mtime >= last_modified:
+                return True
+
+        return False
+
+    def get_latest_module(self, module_id, latest_item, zip_file):
+        local_module = latest_item.get_prop()
+        if local_module is not None:
+            return OnlineModule.from_dict(local_module)
+
+        return self.get_online_module(module_id, zip_file)
+
+    def _set_timestamp(self, timestamp):
+        if self.modules_json.get("metadata") is not None:
+            self.modules_json.metadata.timestamp = timestamp
+        else:
+            self.modules_json.timestamp = timestamp
+
+    def _keep_timestamp(self, last_modules_json):
+        # the timestamp only advances when the content has been changed
+        timestamp = self.modules_json.get_timestamp()
+        self._set_timestamp(last_modules_json.get_timestamp())
+
+        if self.modules_json != last_modules_json:
+            self._set_timestamp(timestamp)
 
-            update_json = UpdateJson.load(update_json_file)
-            latest_item = update_json.versions[-1]
+    def __call__(self, version, to_file, single=False, incremental=False, module_ids=None):
+        tracks = list(self._tracks.get_tracks())
+        max_workers = 1 if single else None
 
-            zip_file = module_folder.joinpath(latest_item.zipfile_name)
-            if not zip_file.exists():
+        if incremental:
+            last_modules, last_modified = self._get_last_modules(version)
+        else:
+            last_modules, last_modified = dict(), 0.0
+
+        def get_module(track):
+            last_module = last_modules.get(track.id)
+            if last_module is None:
+                return self._get_module(track)
+
+            # edits outside of sync (github, track, check, by hand) are found by mtime
+            is_changed = (
+                (module_ids is not None and track.id in module_ids)
+                or self._is_changed(track, last_modified)
+            )
+
+            if is_changed:
+                return self._get_module(track)
+            else:
+                return last_module
+
+        # modules are loaded in parallel, but added in the order of tracks,
+        # so the output is the same as the single-threaded mode
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(get_module, tracks))
+
+        self.modules_json = self._create_modules_json(version)
+        for result in results:
+            if result is None:
                 continue
 
-            online_module = self.get_online_module(track.id, zip_file)
-            if online_module is None:
+            if isinstance(result, OnlineModule):
+                self.modules_json.modules.append(result)
                 continue
 
+            track, update_json, online_module = result
             self._add_modules_json(
                 track=track,
                 update_json=update_json,
@@ -118,9 +209,16 @@ class Index:
                 version=version
             )
 
+        if incremental:
+            reused = sum(isinstance(result, OnlineModule) for result in results)
+            self._log.d(f"__call__: {reused} modules are reused from the last index")
+
         self.modules_json.modules.sort(key=lambda v: v.id)
         if to_file:
             json_file = self._json_folder.joinpath(ModulesJson.filename())
+            if json_file.exists():
+                self._keep_timestamp(ModulesJson.load(json_file))
+
             self.modules_json.write(json_file)
 
         return self.modules_json
@@ -132,6 +230,10 @@ class Index:
 
         repo = Repo(self._root_folder)
         repo.git.add(all=True)
+        if not repo.is_dirty():
+            self._log.i("push_by_git: nothing to commit")
+            return
+
         repo.index.commit(msg)
         repo.remote().push(branch)
 
@@ -140,19 +242,17 @@ class Index:
         table = []
 
         for track in self._tracks.get_tracks():
-            module_folder = self._modules_folder.joinpath(track.id)
-            update_json_file = module_folder.joinpath(UpdateJson.filename())
+            module = self._tracks.snapshot.get(track.id)
 
-            if not update_json_file.exists():
+            if module.update_json is None:
                 table.append(
                     [track.id, "-", "-"]
                 )
                 continue
 
-            update_json = UpdateJson.load(update_json_file)
-            latest = update_json.versions[-1]
-            zip_file = module_folder.joinpath(latest.zipfile_name)
-            online_module = self.get_online_module(track.id, zip_file)
+            latest = module.update_json.versions[-1]
+            zip_file = module.folder.joinpath(latest.zipfile_name)
+            online_module = self.get_latest_module(track.id, latest, zip_file)
 
             if online_module is not None:
                 name = online_module.name.replace("|", "-")
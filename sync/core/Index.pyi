@@ -1,12 +1,13 @@
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict
 
 from ..model import (
     ConfigJson,
     TrackJson,
     OnlineModule,
     ModulesJson,
-    UpdateJson
+    UpdateJson,
+    VersionItem
 )
 from ..track import LocalTracks
 from ..utils import Log
@@ -27,7 +28,22 @@ class Index:
     latest_version: int
 
     def __init__(self, root_folder: Path, config: ConfigJson): ...
-    def __call__(self, version: int, to_file: bool) -> ModulesJson: ...
+    def _get_module(self, track: TrackJson) -> Optional[Tuple[TrackJson, UpdateJson, OnlineModule]]: ...
+    def _get_last_modules(self, version: int) -> Tuple[Dict[str, OnlineModule], float]: ...
+    def _is_changed(self, track: TrackJson, last_modified: float) -> bool: ...
+    def _set_timestamp(self, timestamp: float): ...
+    def _keep_timestamp(self, last_modules_json: ModulesJson): ...
+    def __call__(
+        self,
+        version: int,
+        to_file: bool,
+        single: bool = ...,
+        incremental: bool = ...,
+        module_ids: Optional[List[str]] = ...
+    ) -> ModulesJson: ...
+    def _create_modules_json_0(self) -> ModulesJson: ...
+    def _create_modules_json_1(self) -> ModulesJson: ...
+    def _create_modules_json(self, version: int) -> ModulesJson: ...
     def _add_modules_json_0(
         self,
         track: TrackJson,
@@ -48,5 +64,11 @@ class Index:
         version: int
     ): ...
     def get_online_module(self, module_id: str, zip_file: Path) -> Optional[OnlineModule]: ...
+    def get_latest_module(
+        self,
+        module_id: str,
+        latest_item: VersionItem,
+        zip_file: Path
+    ) -> Optional[OnlineModule]: ...
     def push_by_git(self, branch: str): ...
     def get_versions_table(self) -> str: ...
\ No newline at end of file
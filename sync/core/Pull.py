@@ -1,10 +1,12 @@
+import filecmp
 import shutil
 
 from .Config import Config
-from ..error import Result
+from ..error import Result, OversizeError
 from ..model import (
     LocalModule,
     AttrDict,
+    JsonIO,
     MagiskUpdateJson,
     OnlineModule,
     TrackType,
@@ -20,24 +22,51 @@ from ..utils import (
 
 class Pull:
     _max_size = 50
+    _use_cache = True
 
     def __init__(self, root_folder, config):
         self._log = Log("Pull", enable_log=config.enable_log, log_dir=config.log_dir)
 
         self._local_folder = Config.get_local_folder(root_folder)
         self._modules_folder = Config.get_modules_folder(root_folder)
+        self._root_folder = root_folder
         self._config = config
 
+    @property
+    def _cache_folder(self):
+        # created on first use, nothing is written with --no-cache
+        return Config.get_cache_folder(self._root_folder)
+
     @staticmethod
     def _copy_file(old, new, delete_old):
-        shutil.copy(old, new)
+        # an identical file is not rewritten, avoid changes in git
+        if not (new.exists() and filecmp.cmp(old, new, shallow=False)):
+            shutil.copy(old, new)
+
         if delete_old:
             old.unlink()
 
     @staticmethod
     @Result.catching()
-    def _download(url, out):
-        return HttpUtils.download(url, out)
+    def _download(url, out, use_cache=False, max_size=None):
+        return HttpUtils.download(url, out, use_cache=use_cache, max_size=max_size)
+
+    def _download_zip(self, module_id, url, out):
+        max_size = int(self._max_size * (1024 ** 2))
+        result = self._download(url, out, max_size=max_size)
+
+        if isinstance(result.error, OversizeError):
+            self._move_to_local(module_id)
+
+        return result
+
+    def _move_to_local(self, module_id):
+        module_folder = self._modules_folder.joinpath(module_id)
+        new_module_folder = self._local_folder.joinpath(module_id)
+        msg = f"zip file is oversize ({self._max_size} MB), move this module to {new_module_folder}"
+        self._log.w(f"_move_to_local: [{module_id}] -> {msg}")
+        shutil.rmtree(new_module_folder, ignore_errors=True)
+        shutil.move(module_folder, new_module_folder)
 
     def _check_changelog(self, module_id, file):
         text = file.read_text()
@@ -61,6 +90,87 @@ class Pull:
         self._log.i(f"_check_version_code: [{module_id}] -> already the latest version")
         return False
 
+    def _check_remote_zip(self, module_id, url):
+        json_file = self._modules_folder.joinpath(module_id, UpdateJson.filename())
+        if not json_file.exists():
+            return True
+
+        @Result.catching()
+        def get_local_module():
+            props = HttpUtils.read_zip_file(url, "module.prop")
+            if props is None:
+                return None
+
+            return LocalModule.parse_props(props.decode("utf-8"))
+
+        result = get_local_module()
+        if result.is_failure or result.value is None or result.value.versionCode is None:
+            self._log.d(f"_check_remote_zip: [{module_id}] -> range request failed, fall back to download")
+            return True
+
+        local_module: LocalModule = result.value
+        return self._check_version_code(module_id, local_module.versionCode)
+
+    def _has_latest_zip(self, module_id):
+        module_folder = self._modules_folder.joinpath(module_id)
+        json_file = module_folder.joinpath(UpdateJson.filename())
+        if not json_file.exists():
+            return False
+
+        update_json = UpdateJson.load(json_file)
+        if len(update_json.versions) == 0:
+            return False
+
+        return module_folder.joinpath(update_json.versions[-1].zipfile_name).exists()
+
+    def _get_commit_file(self, module_id):
+        return self._cache_folder.joinpath("commits", f"{module_id}.json")
+
+    def _check_remote_head(self, track):
+        if not self._use_cache:
+            return True, None
+
+        head = GitUtils.get_remote_head(track.update_to)
+        if head is None:
+            return True, None
+
+        # the module has been removed or quarantined locally, rebuild it
+        if not self._has_latest_zip(track.id):
+            return True, head
+
+        commit_file = self._get_commit_file(track.id)
+        if commit_file.exists():
+            obj = JsonIO.load(commit_file)
+            if obj.get("url") == track.update_to and obj.get("commit") == head:
+                self._log.i(f"_check_remote_head: [{track.id}] -> no new commit ({head[:7]})")
+                return False, head
+
+        return True, head
+
+    def _set_remote_head(self, track, head):
+        if head is None:
+            return
+
+        # the same commit always gives the same result, skip it next time
+        commit = AttrDict(url=track.update_to, commit=head)
+        JsonIO.write(commit, self._get_commit_file(track.id))
+
+    def _check_git_version(self, module_id, mirror):
+        props = GitUtils.read_file(mirror, "module.prop")
+        if props is None:
+            return True
+
+        @Result.catching()
+        def get_local_module():
+            return LocalModule.parse_props(props)
+
+        result = get_local_module()
+        if result.is_failure or result.value.versionCode is None:
+            return True
+
+        local_module: LocalModule = result.value
+        return self._check_version_code(module_id, local_module.versionCode)
+
     def _get_file_url(self, module_id, file):
         module_folder = self._modules_folder.joinpath(module_id)
         url = f"{self._config.base_url}{self._modules_folder.name}/{module_id}/{file.name}"
@@ -83,7 +193,7 @@ class Pull:
                 return None
 
             changelog_file = self._modules_folder.joinpath(module_id, f"{module_id}.md")
-            result = self._download(changelog, changelog_file)
+            result = self._download(changelog, changelog_file, use_cache=True)
             if result.is_failure:
                 msg = Log.get_msg(result.error)
                 self._log.e(f"_get_changelog_common: [{module_id}] -> {msg}")
@@ -111,17 +221,13 @@ class Pull:
 
         zip_file_size = zip_file.stat().st_size / (1024 ** 2)
         if zip_file_size > self._max_size:
-            new_module_folder = self._local_folder.joinpath(module_id)
-            msg = f"zip file is oversize ({self._max_size} MB), move this module to {new_module_folder}"
-            self._log.w(f"_from_zip_common: [{module_id}] -> {msg}")
-            shutil.rmtree(new_module_folder, ignore_errors=True)
-            shutil.move(module_folder, new_module_folder)
-
+            self._move_to_local(module_id)
             return None
 
         @Result.catching()
         def get_online_module():
-            local_module = LocalModule.load(zip_file)
+            # a downloaded zip is removed or renamed below, it is not cached
+            local_module = LocalModule.load(zip_file, use_cache=not delete_tmp)
             return OnlineModule.from_dict(local_module)
 
         result = get_online_module()
@@ -177,8 +283,10 @@ class Pull:
 
         zip_file = self._modules_folder.joinpath(track.id, f"{track.id}.zip")
 
-        result = self._download(update_json.zipUrl, zip_file)
-        if result.is_failure:
+        result = self._download_zip(track.id, update_json.zipUrl, zip_file)
+        if isinstance(result.error, OversizeError):
+            return None, 0.0
+        elif result.is_failure:
             msg = Log.get_msg(result.error)
             self._log.e(f"from_json: [{track.id}] -> {msg}")
             return None, 0.0
@@ -190,10 +298,15 @@ class Pull:
         return online_module, last_modified
 
     def from_url(self, track):
+        if not self._check_remote_zip(track.id, track.update_to):
+            return None, 0.0
+
         zip_file = self._modules_folder.joinpath(track.id, f"{track.id}.zip")
 
-        result = self._download(track.update_to, zip_file)
-        if result.is_failure:
+        result = self._download_zip(track.id, track.update_to, zip_file)
+        if isinstance(result.error, OversizeError):
+            return None, 0.0
+        elif result.is_failure:
             msg = Log.get_msg(result.error)
             self._log.e(f"from_url: [{track.id}] -> {msg}")
             return None, 0.0
@@ -205,11 +318,33 @@ class Pull:
         return online_module, last_modified
 
     def from_git(self, track):
+        updatable, head = self._check_remote_head(track)
+        if not updatable:
+            return None, 0.0
+
+        strategy = track.clone_strategy or self._config.clone_strategy or "full"
+
+        @Result.catching()
+        def git_fetch():
+            return GitUtils.fetch_mirror(track.update_to, strategy)
+
+        result = git_fetch()
+        if result.is_failure:
+            msg = Log.get_msg(result.error)
+            self._log.e(f"from_git: [{track.id}] -> {msg}")
+            return None, 0.0
+        else:
+            mirror = result.value
+
+        if mirror is not None and not self._check_git_version(track.id, mirror):
+            self._set_remote_head(track, head)
+            return None, 0.0
+
         zip_file = self._modules_folder.joinpath(track.id, f"{track.id}.zip")
 
         @Result.catching()
         def git_clone():
-            return GitUtils.clone_and_zip(track.update_to, zip_file)
+            return GitUtils.clone_and_zip(track.update_to, zip_file, mirror, strategy)
 
         result = git_clone()
         if result.is_failure:
@@ -221,6 +356,11 @@ class Pull:
 
         changelog = self._get_changelog_common(track.id, track.changelog)
         online_module = self._from_zip_common(track.id, zip_file, changelog, delete_tmp=True)
+
+        # a failed build is retried next time, even without new commits
+        if online_module is not None:
+            self._set_remote_head(track, head)
+
         return online_module, last_committed
 
     def from_zip(self, track):
@@ -259,3 +399,7 @@ class Pull:
     @classmethod
     def set_max_size(cls, value):
         cls._max_size = value
+
+    @classmethod
+    def set_use_cache(cls, value):
+        cls._use_cache = value
@@ -1,6 +1,8 @@
 from pathlib import Path
 from typing import Optional, Tuple
 
+from git import Repo
+
 from ..error import Result
 from ..model import (
     TrackJson,
@@ -15,18 +17,35 @@ class Pull:
 
     _local_folder: Path
     _modules_folder: Path
+    _root_folder: Path
     _config: ConfigJson
 
     _max_size: float
+    _use_cache: bool
 
     def __init__(self, root_folder: Path, config: ConfigJson): ...
+    @property
+    def _cache_folder(self) -> Path: ...
     @staticmethod
     def _copy_file(old: Path, new: Path, delete_old: bool): ...
     @staticmethod
     @Result.catching()
-    def _download(url: str, out: Path) -> Result: ...
+    def _download(
+        url: str,
+        out: Path,
+        use_cache: bool = ...,
+        max_size: Optional[int] = ...
+    ) -> Result: ...
+    def _download_zip(self, module_id: str, url: str, out: Path) -> Result: ...
+    def _move_to_local(self, module_id: str): ...
     def _check_changelog(self, module_id: str, file: Path) -> bool: ...
     def _check_version_code(self, module_id: str, version_code: int) -> bool: ...
+    def _check_remote_zip(self, module_id: str, url: str) -> bool: ...
+    def _has_latest_zip(self, module_id: str) -> bool: ...
+    def _get_commit_file(self, module_id: str) -> Path: ...
+    def _check_remote_head(self, track: TrackJson) -> Tuple[bool, Optional[str]]: ...
+    def _set_remote_head(self, track: TrackJson, head: Optional[str]): ...
+    def _check_git_version(self, module_id: str, mirror: Repo) -> bool: ...
     def _get_file_url(self, module_id: str, file: Path) -> str: ...
     def _get_changelog_common(self, module_id: str, changelog: Optional[str]) -> Optional[Path]: ...
     def _from_zip_common(
@@ -44,3 +63,5 @@ class Pull:
     def from_track(self, track: TrackJson) -> Tuple[Optional[OnlineModule], float]: ...
     @classmethod
     def set_max_size(cls, value: float): ...
+    @classmethod
+    def set_use_cache(cls, value: bool): ...
@@ -10,7 +10,7 @@ from ..model import (
     TrackJson
 )
 from ..track import BaseTracks, LocalTracks, GithubTracks
-from ..utils import Log
+from ..utils import Log, HttpUtils
 
 
 class Sync:
@@ -90,11 +90,11 @@ class Sync:
 
         if len(update_json.versions) >= 2:
             self._updated_diff.append(
-                (update_json.versions[-2], online_module)
+                (track.id, update_json.versions[-2], online_module)
             )
         else:
             self._updated_diff.append(
-                (None, online_module)
+                (track.id, None, online_module)
             )
 
         return online_module
@@ -139,7 +139,10 @@ class Sync:
         else:
             tracks = self._tracks.get_tracks(module_ids)
 
-        with ThreadPoolExecutor(max_workers=1 if single else None) as executor:
+        max_workers = 1 if single else None
+        HttpUtils.set_pool_size(max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = []
             for track in tracks:
                 futures.append(
@@ -151,6 +154,10 @@ class Sync:
                 if online_module is not None:
                     self._log.i(f"update: [{online_module.id}] -> update to {online_module.version_display}")
 
+    def get_updated_ids(self):
+        # ids of tracks, which may differ from the id in module.prop
+        return [track_id for track_id, *_ in self._updated_diff]
+
     def get_versions_diff(self):
         headers = ["id", "name", "version"]
         table = []
@@ -158,7 +165,7 @@ class Sync:
         if len(self._updated_diff) == 0:
             return None
 
-        for last, new in self._updated_diff:
+        for _, last, new in self._updated_diff:
             version = new.version_display
             if last is not None:
                 version = f"{last.version_display} -> {version}"
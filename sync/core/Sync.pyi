@@ -22,7 +22,7 @@ class Sync:
     _modules_folder: Path
     _config: ConfigJson
     _tracks: BaseTracks
-    _updated_diff: List[Tuple[Optional[VersionItem], OnlineModule]]
+    _updated_diff: List[Tuple[str, Optional[VersionItem], OnlineModule]]
 
     def  __init__(self, root_folder: Path, config: ConfigJson, tracks: Optional[BaseTracks] = ...): ...
     def _update_jsons(self, track: TrackJson, force: bool) -> Optional[OnlineModule]: ...
@@ -37,4 +37,5 @@ class Sync:
         single: bool = ...,
         **kwargs
     ): ...
+    def get_updated_ids(self) -> List[str]: ...
     def get_versions_diff(self) -> Optional[str]: ...
@@ -0,0 +1,2 @@
+class GraphQLError(Exception):
+    """The GitHub GraphQL API reports errors in the response."""
@@ -0,0 +1,2 @@
+class OversizeError(IOError):
+    """A file exceeds the size limit."""
@@ -1,9 +1,13 @@
 from .ConfigError import ConfigError
+from .GraphQLError import GraphQLError
 from .MagiskModuleError import MagiskModuleError
+from .OversizeError import OversizeError
 from .Result import Result
 
 __all__ = [
     "ConfigError",
+    "GraphQLError",
     "MagiskModuleError",
+    "OversizeError",
     "Result"
 ]
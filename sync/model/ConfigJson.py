@@ -8,6 +8,7 @@ class ConfigJson(AttrDict, JsonIO):
     max_num: int
     enable_log: bool
     log_dir: str
+    clone_strategy: str
 
     def write(self, file):
         new = AttrDict()
@@ -16,7 +17,7 @@ class ConfigJson(AttrDict, JsonIO):
             if value is not None:
                 new[key] = value
 
-        JsonIO.write(new, file)
+        return JsonIO.write(new, file)
 
     @classmethod
     def load(cls, file):
@@ -30,7 +31,8 @@ class ConfigJson(AttrDict, JsonIO):
             base_url="",
             max_num=3,
             enable_log=True,
-            log_dir=None
+            log_dir=None,
+            clone_strategy="full"
         )
 
     @classmethod
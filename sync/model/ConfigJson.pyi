@@ -19,8 +19,9 @@ class ConfigJson(AttrDict, JsonIO):
     max_num: int
     enable_log: bool
     log_dir: Optional[Path]
+    clone_strategy: str
 
-    def write(self: Union[Self, Dict], file: Path): ...
+    def write(self: Union[Self, Dict], file: Path) -> bool: ...
     @classmethod
     def load(cls, file: Path) -> ConfigJson: ...
     @classmethod
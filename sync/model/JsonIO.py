@@ -1,25 +1,38 @@
 import json
-import re
+import os
+import threading
+
+from ..utils import JsonUtils
 
 
 class JsonIO:
     def write(self, file):
         assert isinstance(self, dict)
 
+        content = json.dumps(self, indent=2).encode("utf-8")
+        if file.exists() and file.read_bytes() == content:
+            return False
+
         file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file, "w") as f:
-            json.dump(self, f, indent=2)
+        # readers never see a partially written file
+        tmp = file.with_name(f"{file.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(content)
+            os.replace(tmp, file)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+        return True
 
     @classmethod
     def filter(cls, text):
-        return re.sub(r",(?=\s*?[}\]])", "", text)
+        return JsonUtils.filter(text)
 
     @classmethod
     def load(cls, file):
         with open(file, encoding="utf-8", mode="r") as f:
-            text = cls.filter(f.read())
-            obj = json.loads(text)
+            obj = JsonUtils.loads(f.read())
 
             assert isinstance(obj, dict)
 
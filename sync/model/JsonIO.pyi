@@ -3,7 +3,7 @@ from typing import Dict
 
 
 class JsonIO:
-    def write(self: Dict, file: Path): ...
+    def write(self: Dict, file: Path) -> bool: ...
     @classmethod
     def filter(cls, text: str) -> str: ...
     @classmethod
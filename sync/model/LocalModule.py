@@ -1,7 +1,9 @@
+from pathlib import Path
 from zipfile import ZipFile
 
 from .AttrDict import AttrDict
 from ..error import MagiskModuleError
+from ..utils import SqliteCache
 
 
 class LocalModule(AttrDict):
@@ -12,31 +14,79 @@ class LocalModule(AttrDict):
     author: str
     description: str
 
+    _cache = None
+
     @classmethod
-    def load(cls, file):
-        zipfile = ZipFile(file, "r")
-        fields = cls.expected_fields()
+    def set_cache_folder(cls, cache_folder):
+        if cls._cache is not None:
+            cls._cache.close()
 
-        try:
-            if (
-                "#MAGISK" not in zipfile
-                .read("META-INF/com/google/android/updater-script")
-                .decode("utf-8")
-            ):
-                raise
-
-            zipfile.read("META-INF/com/google/android/update-binary")
-        except BaseException:
-            msg = f"{file.name} is not a magisk module"
-            raise MagiskModuleError(msg)
+        if cache_folder is None:
+            cls._cache = None
+        else:
+            cls._cache = SqliteCache(cache_folder.joinpath("modules.db"), "modules")
+
+    @classmethod
+    def prune_cache(cls):
+        if cls._cache is None:
+            return
+
+        for key in cls._cache.keys():
+            if not Path(key).exists():
+                cls._cache.delete(key)
+
+    @classmethod
+    def load(cls, file, *, use_cache=True):
+        # a temporary file would only leave a dead entry
+        if cls._cache is None or not use_cache:
+            return cls._load(file)
+
+        stat = file.stat()
+        key = file.resolve().as_posix()
+        stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+
+        obj = cls._cache.get(key, stamp)
+        if obj is not None:
+            return LocalModule(obj)
 
         try:
-            props = zipfile.read("module.prop")
-        except BaseException as err:
-            raise MagiskModuleError(err.args)
+            local_module = cls._load(file)
+        except MagiskModuleError:
+            cls._cache.delete(key)
+            raise
+
+        cls._cache.set(key, stamp, local_module)
+        return local_module
+
+    @classmethod
+    def _load(cls, file):
+        # only the central directory is parsed, update-binary is checked by name
+        with ZipFile(file, "r") as zipfile:
+            try:
+                names = set(zipfile.namelist())
+                if (
+                    "META-INF/com/google/android/update-binary" not in names
+                    or b"#MAGISK" not in zipfile.read("META-INF/com/google/android/updater-script")
+                ):
+                    raise
+
+            except BaseException:
+                msg = f"{file.name} is not a magisk module"
+                raise MagiskModuleError(msg)
+
+            try:
+                props = zipfile.read("module.prop")
+            except BaseException as err:
+                raise MagiskModuleError(err.args)
+
+        return cls.parse_props(props.decode("utf-8"))
+
+    @classmethod
+    def parse_props(cls, props):
+        fields = cls.expected_fields()
 
         obj = AttrDict()
-        for item in props.decode("utf-8").splitlines():
+        for item in props.splitlines():
             prop = item.split("=", maxsplit=1)
             if len(prop) != 2:
                 continue
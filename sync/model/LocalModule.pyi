@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import Dict, Type
+from typing import Dict, Type, Optional
 
 from .AttrDict import AttrDict
+from ..utils import SqliteCache
 
 
 class LocalModule(AttrDict):
@@ -12,7 +13,17 @@ class LocalModule(AttrDict):
     author: str
     description: str
 
+    _cache: Optional[SqliteCache]
+
+    @classmethod
+    def set_cache_folder(cls, cache_folder: Optional[Path]): ...
+    @classmethod
+    def prune_cache(cls): ...
+    @classmethod
+    def load(cls, file: Path, *, use_cache: bool = ...) -> LocalModule: ...
+    @classmethod
+    def _load(cls, file: Path) -> LocalModule: ...
     @classmethod
-    def load(cls, file: Path) -> LocalModule: ...
+    def parse_props(cls, props: str) -> LocalModule: ...
     @classmethod
     def expected_fields(cls, __type: bool = ...) -> Dict[str, Type]: ...
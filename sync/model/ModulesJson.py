@@ -1,5 +1,6 @@
 from .AttrDict import AttrDict
 from .JsonIO import JsonIO
+from .LocalModule import LocalModule
 from .UpdateJson import VersionItem
 from ..utils import StrUtils
 
@@ -23,7 +24,8 @@ class OnlineModule(AttrDict):
             version=self.version,
             versionCode=self.versionCode,
             zipUrl=self.latest.zipUrl,
-            changelog=self.latest.changelog
+            changelog=self.latest.changelog,
+            prop=AttrDict({key: self.get(key) for key in LocalModule.expected_fields()})
         )
 
     @classmethod
@@ -54,6 +56,13 @@ class ModulesJson(AttrDict, JsonIO):
 
         return value0 or value1 or 0.0
 
+    def get_version(self):
+        metadata = self.get("metadata")
+        if metadata is not None:
+            return metadata.get("version", 0)
+
+        return 0
+
     @classmethod
     def load(cls, file):
         obj = JsonIO.load(file)
@@ -38,6 +38,7 @@ class ModulesJson(AttrDict, JsonIO):
     @property
     def size(self) -> int: ...
     def get_timestamp(self) -> float: ...
+    def get_version(self) -> int: ...
     @classmethod
     def load(cls, file: Path) -> ModulesJson: ...
     @classmethod
@@ -2,6 +2,7 @@ from enum import Enum
 
 from .AttrDict import AttrDict
 from .JsonIO import JsonIO
+from ..utils import SqliteCache
 
 
 class TrackJson(AttrDict, JsonIO):
@@ -15,6 +16,9 @@ class TrackJson(AttrDict, JsonIO):
     support: str
     donate: str
     max_num: int
+    clone_strategy: str
+
+    _cache = None
 
     # noinspection PyAttributeOutsideInit
     @property
@@ -74,11 +78,46 @@ class TrackJson(AttrDict, JsonIO):
 
             new[key] = value
 
-        JsonIO.write(new, file)
+        is_written = JsonIO.write(new, file)
+
+        if self._cache is not None:
+            key, stamp = self._get_cache_key(file)
+            self._cache.set(key, stamp, new)
+
+        return is_written
+
+    @classmethod
+    def set_cache_folder(cls, cache_folder):
+        if cls._cache is not None:
+            cls._cache.close()
+
+        if cache_folder is None:
+            cls._cache = None
+        else:
+            cls._cache = SqliteCache(cache_folder.joinpath("modules.db"), "tracks")
+
+    @classmethod
+    def clear_cache(cls, file):
+        if cls._cache is not None:
+            cls._cache.delete(file.resolve().as_posix())
+
+    @classmethod
+    def _get_cache_key(cls, file):
+        stat = file.stat()
+        return file.resolve().as_posix(), f"{stat.st_size}:{stat.st_mtime_ns}"
 
     @classmethod
     def load(cls, file):
-        obj = JsonIO.load(file)
+        if cls._cache is None:
+            return TrackJson(JsonIO.load(file))
+
+        # only a stat is needed for an unchanged track
+        key, stamp = cls._get_cache_key(file)
+        obj = cls._cache.get(key, stamp)
+        if obj is None:
+            obj = JsonIO.load(file)
+            cls._cache.set(key, stamp, obj)
+
         return TrackJson(obj)
 
     @classmethod
@@ -1,9 +1,10 @@
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Type
+from typing import Dict, Type, Optional, Tuple
 
 from .AttrDict import AttrDict
 from .JsonIO import JsonIO
+from ..utils import SqliteCache
 
 
 class TrackJson(AttrDict, JsonIO):
@@ -17,16 +18,25 @@ class TrackJson(AttrDict, JsonIO):
     support: str
     donate: str
     max_num: int
+    clone_strategy: str
 
     # without manually
     added: float
     last_update: float
     versions: int
 
+    _cache: Optional[SqliteCache]
+
     @property
     def type(self) -> TrackType: ...
     def json(self) -> AttrDict: ...
-    def write(self, file: Path): ...
+    def write(self, file: Path) -> bool: ...
+    @classmethod
+    def set_cache_folder(cls, cache_folder: Optional[Path]): ...
+    @classmethod
+    def clear_cache(cls, file: Path): ...
+    @classmethod
+    def _get_cache_key(cls, file: Path) -> Tuple[str, str]: ...
     @classmethod
     def load(cls, file: Path) -> TrackJson: ...
     @classmethod
@@ -1,5 +1,6 @@
 from .AttrDict import AttrDict
 from .JsonIO import JsonIO
+from .LocalModule import LocalModule
 from ..utils import StrUtils
 
 
@@ -20,6 +21,15 @@ class VersionItem(AttrDict):
     def zipfile_name(self):
         return self.zipUrl.split("/")[-1]
 
+    def get_prop(self):
+        if self.prop is None:
+            return None
+
+        return LocalModule(self.prop)
+
+    def without_prop(self):
+        return VersionItem({k: v for k, v in self.items() if k != "prop"})
+
 
 class UpdateJson(AttrDict, JsonIO):
     @classmethod
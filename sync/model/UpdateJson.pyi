@@ -1,8 +1,9 @@
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Dict, Any
 
 from .AttrDict import AttrDict
 from .JsonIO import JsonIO
+from .LocalModule import LocalModule
 
 
 class VersionItem(AttrDict):
@@ -12,6 +13,9 @@ class VersionItem(AttrDict):
     zipUrl: str
     changelog: str
 
+    # fields of module.prop, for listing without opening the zip file
+    prop: Optional[Dict[str, Any]]
+
     @property
     def id(self) -> str: ...
     @property
@@ -20,6 +24,8 @@ class VersionItem(AttrDict):
     def changelog_filename(self) -> str: ...
     @property
     def zipfile_name(self) -> str: ...
+    def get_prop(self) -> Optional[LocalModule]: ...
+    def without_prop(self) -> VersionItem: ...
 
 
 class UpdateJson(AttrDict, JsonIO):
@@ -1,19 +1,26 @@
 import concurrent.futures
+import itertools
 import shutil
 from concurrent.futures import ThreadPoolExecutor
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 
-from github import Github, Auth, UnknownObjectException
-from github.Repository import Repository
+from dateutil.parser import parse
+from github import Github, Auth
 
 from .BaseTracks import BaseTracks
 from .LocalTracks import LocalTracks
+from .RepoSnapshot import RepoSnapshot
 from ..error import MagiskModuleError, Result
 from ..model import TrackJson
-from ..utils import Log, GitHubGraphQLAPI
+from ..utils import Log, GitHubGraphQLAPI, HttpUtils, RateLimiter, SqliteCache
 
 
 class GithubTracks(BaseTracks):
+    _batch_size = 50
+    _max_workers = 4
+    _empty_grace_period = timedelta(days=1)
+    _cache = None
+
     def __init__(self, modules_folder, config, *, api_token, after_date=None):
         self._log = Log("GithubTracks", enable_log=config.enable_log, log_dir=config.log_dir)
         self._modules_folder = modules_folder
@@ -23,76 +30,143 @@ class GithubTracks(BaseTracks):
 
         self._api_token = api_token
         self._after_date = after_date
-        self._github = Github(auth=Auth.Token(api_token))
-        self._graphql_api = GitHubGraphQLAPI(api_token=api_token)
+        self._github = Github(auth=Auth.Token(api_token), per_page=100)
+        self._graphql_api = GitHubGraphQLAPI(
+            api_token=api_token,
+            rate_limiter=RateLimiter(
+                "graphql",
+                log=Log("RateLimiter", enable_log=config.enable_log, log_dir=config.log_dir)
+            )
+        )
         self._tracks = list()
 
-    @Result.catching()
-    def _get_from_repo_common(self, repo: Repository, use_ssh):
-        if not self.is_module_repo(repo):
-            raise MagiskModuleError(f"{repo.name} is not a target magisk module repository")
+    @classmethod
+    def _get_raw_url(cls, repository, path):
+        owner = repository["owner"]["login"]
+        branch = repository["defaultBranchRef"]["name"]
+        return f"https://raw.githubusercontent.com/{owner}/{repository['name']}/{branch}/{path}"
 
-        try:
-            update_to = repo.get_contents("update.json").download_url
+    @Result.catching()
+    def _get_from_repo_common(self, repository, use_ssh):
+        name = repository["name"]
+        if not all(repository[key] is not None for key in ["moduleProp", "updateBinary", "updaterScript"]):
+            raise MagiskModuleError(f"{name} is not a target magisk module repository")
+
+        clone_url = f"{repository['url']}.git"
+        if repository["updateJson"] is not None:
+            update_to = self._get_raw_url(repository, "update.json")
             changelog = ""
-        except UnknownObjectException:
+        else:
             if use_ssh:
-                update_to = repo.ssh_url
+                update_to = repository["sshUrl"]
+            else:
+                update_to = clone_url
+
+            if repository["changelog"] is not None:
+                changelog = self._get_raw_url(repository, "changelog.md")
             else:
-                update_to = repo.clone_url
-            changelog = self.get_changelog(repo)
+                changelog = ""
 
-        if repo.has_issues:
-            issues = f"{repo.html_url}/issues"
+        if repository["hasIssuesEnabled"]:
+            issues = f"{repository['url']}/issues"
         else:
             issues = ""
 
-        donate_urls = self._graphql_api.get_sponsor_url(
-            owner=repo.owner.login,
-            name=repo.name
-        )
+        donate_urls = GitHubGraphQLAPI.get_sponsor_urls(repository["fundingLinks"])
         if len(donate_urls) == 0:
             donate = ""
         else:
             donate = donate_urls[0]
 
-        homepage = self._graphql_api.get_homepage_url(
-            owner=repo.owner.login,
-            name=repo.name
-        )
-        if homepage is None:
-            homepage = ""
+        license_info = repository["licenseInfo"]
+        if license_info is None:
+            _license = ""
+        elif license_info["spdxId"] in [None, "NOASSERTION"]:
+            _license = "UNKNOWN"
+        else:
+            _license = license_info["spdxId"]
 
         return TrackJson(
-            id=repo.name,
+            id=name,
             update_to=update_to,
-            license=self.get_license(repo),
+            license=_license,
             changelog=changelog,
-            homepage=homepage,
-            source=repo.clone_url,
+            homepage=repository["homepageUrl"] or "",
+            source=clone_url,
             support=issues,
             donate=donate
         )
 
-    def _get_from_repo(self, repo, cover, use_ssh):
-        self._log.d(f"_get_from_repo: repo_name = {repo.name}")
+    @Result.catching()
+    def _get_repositories(self, user_name, repo_names, shallow):
+        return self._graphql_api.get_repositories(owner=user_name, names=repo_names, shallow=shallow)
+
+    @classmethod
+    def _get_cache_key(cls, repository, use_ssh):
+        key = f"{repository['owner']['login']}/{repository['name']}"
+        stamp = f"{repository['pushedAt']}:{'ssh' if use_ssh else 'https'}"
+        return key, stamp
 
-        pushed_at = self._graphql_api.get_pushed_at(
-            owner=repo.owner.login,
-            name=repo.name
-        )
-        if pushed_at is None:
+    def _is_stale(self, repository, use_ssh):
+        if not self._is_recent(repository):
+            return False
+
+        key, stamp = self._get_cache_key(repository, use_ssh)
+        return self._cache.get(key, stamp) is None
+
+    def _is_recent(self, repository):
+        if repository is None or repository["pushedAt"] is None:
+            return False
+
+        pushed_at = parse(repository["pushedAt"])
+        return pushed_at.date() >= self._after_date
+
+    def _get_from_cache(self, repository, use_ssh):
+        if self._cache is None:
+            return self._get_from_repo_common(repository, use_ssh)
+
+        key, stamp = self._get_cache_key(repository, use_ssh)
+        value = self._cache.get(key, stamp)
+        if value is not None:
+            if "error" in value:
+                return Result(error=MagiskModuleError(value["error"]))
+            else:
+                return Result(value=TrackJson(value))
+
+        result = self._get_from_repo_common(repository, use_ssh)
+        if result.is_success:
+            self._cache.set(key, stamp, dict(result.value))
+        elif isinstance(result.error, MagiskModuleError):
+            self._cache.set(key, stamp, {"error": str(result.error)})
+
+        return result
+
+    def _get_from_repo(self, repo_name, repository, cover, use_ssh):
+        self._log.d(f"_get_from_repo: repo_name = {repo_name}")
+
+        if repository.is_failure:
+            msg = Log.get_msg(repository.error)
+            self._log.e(f"_get_from_repo: [{repo_name}] -> {msg}")
+            return None
+
+        repository = repository.value
+        if repository is None:
+            self._log.e(f"_get_from_repo: [{repo_name}] -> repository not found")
             return None
 
-        if pushed_at.date() < self._after_date:
+        if repository["pushedAt"] is None:
+            return None
+
+        if not self._is_recent(repository):
+            pushed_at = parse(repository["pushedAt"])
             msg = f"pushed at {pushed_at.date()}, too old"
-            self._log.w(f"_get_from_repo: [{repo.name}] -> {msg}")
+            self._log.w(f"_get_from_repo: [{repo_name}] -> {msg}")
             return None
 
-        result = self._get_from_repo_common(repo, use_ssh)
+        result = self._get_from_cache(repository, use_ssh)
         if result.is_failure:
             msg = Log.get_msg(result.error)
-            self._log.e(f"_get_from_repo: [{repo.name}] -> {msg}")
+            self._log.e(f"_get_from_repo: [{repo_name}] -> {msg}")
             return None
         else:
             track_json: TrackJson = result.value
@@ -100,51 +174,155 @@ class GithubTracks(BaseTracks):
 
             return track_json
 
+    def _query_repositories(self, user_name, repo_names, shallow):
+        result = self._get_repositories(user_name, repo_names, shallow)
+        if result.is_success:
+            return result.value
+
+        msg = Log.get_msg(result.error)
+        if len(repo_names) == 1:
+            self._log.e(f"_query_repositories: [{repo_names[0]}] -> {msg}")
+            return dict()
+
+        # one bad repository should not cost the whole batch, the halves are queried again
+        self._log.w(f"_query_repositories: [{repo_names[0]}..{repo_names[-1]}] -> {msg}, split")
+        middle = len(repo_names) // 2
+        repositories = self._query_repositories(user_name, repo_names[:middle], shallow)
+        repositories.update(self._query_repositories(user_name, repo_names[middle:], shallow))
+
+        return repositories
+
+    def _get_from_repos(self, user_name, repo_names, cover, use_ssh):
+        # with the cache, only pushedAt is queried first, and all fields are queried for stale entries
+        shallow = self._cache is not None
+        repositories = self._query_repositories(user_name, repo_names, shallow)
+
+        if shallow:
+            stale_names = [
+                repo_name for repo_name, repository in repositories.items()
+                if repository.is_success and self._is_stale(repository.value, use_ssh)
+            ]
+
+            if len(stale_names) != 0:
+                for repo_name in stale_names:
+                    repositories.pop(repo_name)
+
+                repositories.update(self._query_repositories(user_name, stale_names, False))
+
+        tracks = list()
+        for repo_name, repository in repositories.items():
+            track_json = self._get_from_repo(repo_name, repository, cover, use_ssh)
+            if track_json is not None:
+                tracks.append(track_json)
+
+        return tracks
+
     def get_track(self, user_name, repo_name, *, cover=False, use_ssh=True):
-        user = self._github.get_user(user_name)
-        repo = user.get_repo(repo_name)
+        tracks = self._get_from_repos(user_name, [repo_name], cover, use_ssh)
+        if len(tracks) == 0:
+            return None
+
+        return tracks[0]
 
-        return self._get_from_repo(repo, cover, use_ssh)
+    def _get_repo_names(self, user_name, include_forks, include_archived):
+        user = self._github.get_user(user_name)
 
-    def get_tracks(self, user_name, repo_names=None, *, single=False, cover=False, use_ssh=True):
+        # fields of the listing payload, no more requests for each repository
+        for repo in user.get_repos():
+            if repo.fork and not include_forks:
+                self._log.d(f"_get_repo_names: [{repo.name}] -> fork, skipped")
+                continue
+
+            if repo.archived and not include_archived:
+                self._log.d(f"_get_repo_names: [{repo.name}] -> archived, skipped")
+                continue
+
+            if repo.pushed_at is None:
+                continue
+
+            if repo.pushed_at.date() < self._after_date:
+                msg = f"pushed at {repo.pushed_at.date()}, too old"
+                self._log.w(f"_get_repo_names: [{repo.name}] -> {msg}")
+                continue
+
+            # size is computed by GitHub in the background, it may still be 0 after a push
+            if repo.size == 0 and repo.pushed_at < datetime.now(timezone.utc) - self._empty_grace_period:
+                self._log.i(f"_get_repo_names: [{repo.name}] -> empty repository, skipped")
+                continue
+
+            yield repo.name
+
+    def get_tracks(
+        self,
+        user_name,
+        repo_names=None,
+        *,
+        single=False,
+        cover=False,
+        use_ssh=True,
+        include_forks=True,
+        include_archived=True
+    ):
         self._tracks.clear()
         self._log.i(f"get_tracks: user_name = {user_name}")
 
-        user = self._github.get_user(user_name)
-        repos = []
-
-        if repo_names is not None:
-            for repo_name in repo_names:
-                try:
-                    repo = user.get_repo(repo_name)
-                    repos.append(repo)
-                except UnknownObjectException as err:
-                    msg = Log.get_msg(err)
-                    self._log.e(f"get_tracks: [{repo_name}] -> {msg}")
-        else:
-            repos = user.get_repos()
+        if repo_names is None:
+            repo_names = self._get_repo_names(user_name, include_forks, include_archived)
+
+        max_workers = 1 if single else self._max_workers
+        HttpUtils.set_pool_size(max_workers)
+
+        repo_names = iter(repo_names)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = set()
+
+            # repositories are queried in batches by GraphQL while the listing is still paged,
+            # and the number of pending batches is bounded
+            while True:
+                batch = list(itertools.islice(repo_names, self._batch_size))
+                if len(batch) == 0:
+                    break
 
-        with ThreadPoolExecutor(max_workers=1 if single else None) as executor:
-            futures = []
-            for repo in repos:
-                futures.append(
-                    executor.submit(self._get_from_repo, repo=repo, cover=cover, use_ssh=use_ssh)
+                futures.add(
+                    executor.submit(self._get_from_repos, user_name, batch, cover, use_ssh)
                 )
 
+                if len(futures) >= max_workers * 2:
+                    done, futures = concurrent.futures.wait(
+                        futures, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        self._tracks.extend(future.result())
+
             for future in concurrent.futures.as_completed(futures):
-                track_json = future.result()
-                if track_json is not None:
-                    self._tracks.append(track_json)
+                self._tracks.extend(future.result())
 
         self._log.i(f"get_tracks: size = {self.size}")
+        self._log.i(f"get_tracks: graphql -> {self._graphql_api.rate_limiter.budget}")
         return self._tracks
 
+    @classmethod
+    def set_cache_folder(cls, cache_folder):
+        if cls._cache is not None:
+            cls._cache.close()
+
+        if cache_folder is None:
+            cls._cache = None
+        else:
+            cls._cache = SqliteCache(cache_folder.joinpath("modules.db"), "repositories")
+
+        # depends on PyGithub, so it is only imported here
+        from ..utils.GitHubRESTCache import GitHubRESTCache
+        GitHubRESTCache.set_cache_folder(cache_folder)
+
     def clear_tracks(self):
         names = [track.id for track in self._tracks]
-        for module_folder in self._modules_folder.glob("*/"):
-            if module_folder.name not in names:
-                self._log.i(f"clear_tracks: [{module_folder.name}] -> removed")
-                shutil.rmtree(module_folder, ignore_errors=True)
+        snapshot = RepoSnapshot(self._modules_folder).scan(shallow=True)
+        for module in snapshot.modules:
+            if module.id not in names:
+                self._log.i(f"clear_tracks: [{module.id}] -> removed")
+                shutil.rmtree(module.folder, ignore_errors=True)
+                TrackJson.clear_cache(module.folder.joinpath(TrackJson.filename()))
 
     @property
     def size(self):
@@ -153,33 +331,3 @@ class GithubTracks(BaseTracks):
     @property
     def tracks(self):
         return self._tracks
-
-    @classmethod
-    def get_license(cls, repo):
-        try:
-            _license = repo.get_license().license.spdx_id
-            if _license == "NOASSERTION":
-                _license = "UNKNOWN"
-        except UnknownObjectException:
-            _license = ""
-
-        return _license
-
-    @classmethod
-    def get_changelog(cls, repo):
-        try:
-            changelog = repo.get_contents("changelog.md").download_url
-        except UnknownObjectException:
-            changelog = ""
-
-        return changelog
-
-    @classmethod
-    def is_module_repo(cls, repo):
-        try:
-            repo.get_contents("module.prop")
-            repo.get_contents("META-INF/com/google/android/update-binary")
-            repo.get_contents("META-INF/com/google/android/updater-script")
-            return True
-        except UnknownObjectException:
-            return False
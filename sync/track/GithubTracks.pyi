@@ -1,14 +1,13 @@
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple, Iterator, Iterable
 
 from github import Github
-from github.Repository import Repository
 
 from .BaseTracks import BaseTracks
 from ..error import Result
 from ..model import TrackJson, ConfigJson
-from ..utils import Log, GitHubGraphQLAPI
+from ..utils import Log, GitHubGraphQLAPI, SqliteCache
 
 
 class GithubTracks(BaseTracks):
@@ -19,6 +18,10 @@ class GithubTracks(BaseTracks):
     _github: Github
     _graphql_api: GitHubGraphQLAPI
     _tracks: List[TrackJson]
+    _batch_size: int
+    _max_workers: int
+    _empty_grace_period: timedelta
+    _cache: Optional[SqliteCache]
 
     def __init__(
         self,
@@ -28,9 +31,37 @@ class GithubTracks(BaseTracks):
         api_token: str,
         after_date: Optional[date] = ...
     ): ...
+    @classmethod
+    def _get_raw_url(cls, repository: Dict[str, Any], path: str) -> str: ...
+    @Result.catching()
+    def _get_from_repo_common(self, repository: Dict[str, Any], use_ssh: bool) -> Result: ...
     @Result.catching()
-    def _get_from_repo_common(self, repo: Repository, use_ssh: bool) -> Result: ...
-    def _get_from_repo(self, repo: Repository, cover: bool, use_ssh: bool) -> Optional[TrackJson]: ...
+    def _get_repositories(self, user_name: str, repo_names: List[str], shallow: bool) -> Result: ...
+    @classmethod
+    def _get_cache_key(cls, repository: Dict[str, Any], use_ssh: bool) -> Tuple[str, str]: ...
+    def _is_stale(self, repository: Optional[Dict[str, Any]], use_ssh: bool) -> bool: ...
+    def _is_recent(self, repository: Optional[Dict[str, Any]]) -> bool: ...
+    def _get_from_cache(self, repository: Dict[str, Any], use_ssh: bool) -> Result: ...
+    def _get_from_repo(
+        self,
+        repo_name: str,
+        repository: Result,
+        cover: bool,
+        use_ssh: bool
+    ) -> Optional[TrackJson]: ...
+    def _query_repositories(
+        self,
+        user_name: str,
+        repo_names: List[str],
+        shallow: bool
+    ) -> Dict[str, Result]: ...
+    def _get_from_repos(
+        self,
+        user_name: str,
+        repo_names: List[str],
+        cover: bool,
+        use_ssh: bool
+    ) -> List[TrackJson]: ...
     def get_track(
         self,
         user_name: str,
@@ -39,23 +70,27 @@ class GithubTracks(BaseTracks):
         cover: bool = ...,
         use_ssh: bool = ...
     ) -> Optional[TrackJson]: ...
+    def _get_repo_names(
+        self,
+        user_name: str,
+        include_forks: bool,
+        include_archived: bool
+    ) -> Iterator[str]: ...
     def get_tracks(
         self,
         user_name: str,
-        repo_names: Optional[List[str]] = ...,
+        repo_names: Optional[Iterable[str]] = ...,
         *,
         single: bool = ...,
         cover: bool = ...,
-        use_ssh: bool = ...
+        use_ssh: bool = ...,
+        include_forks: bool = ...,
+        include_archived: bool = ...
     ) -> List[TrackJson]: ...
+    @classmethod
+    def set_cache_folder(cls, cache_folder: Optional[Path]): ...
     def clear_tracks(self): ...
     @property
     def size(self) -> int: ...
     @property
     def tracks(self) -> List[TrackJson]: ...
-    @classmethod
-    def get_license(cls, repo: Repository) -> str: ...
-    @classmethod
-    def get_changelog(cls, repo: Repository) -> str: ...
-    @classmethod
-    def is_module_repo(cls, repo: Repository) -> bool: ...
@@ -5,7 +5,7 @@ from typing import List
 from tabulate import tabulate
 
 from .BaseTracks import BaseTracks
-from ..error import Result
+from .RepoSnapshot import RepoSnapshot
 from ..model import TrackJson
 from ..utils import Log
 
@@ -14,35 +14,31 @@ class LocalTracks(BaseTracks):
     def __init__(self, modules_folder, config):
         self._log = Log("LocalTracks", enable_log=config.enable_log, log_dir=config.log_dir)
         self._modules_folder = modules_folder
+        self._snapshot = RepoSnapshot(modules_folder)
 
         self._tracks: List[TrackJson] = list()
 
-    @Result.catching()
-    def _get_from_file(self, file):
-        return TrackJson.load(file)
-
-    def get_track(self, module_id):
-        module_folder = self._modules_folder.joinpath(module_id)
-        json_file = module_folder.joinpath(TrackJson.filename())
-
-        result = self._get_from_file(json_file)
+    def _get_from_snapshot(self, module):
+        result = module.track
         if result.is_failure:
             msg = Log.get_msg(result.error)
-            self._log.e(f"get_track: [{module_id}] -> {msg}")
+            self._log.e(f"get_track: [{module.id}] -> {msg}")
 
             return None
         else:
             return result.value
 
+    def get_track(self, module_id):
+        module = self._snapshot.update(module_id)
+        return self._get_from_snapshot(module)
+
     def get_tracks(self, module_ids=None):
         self._tracks.clear()
         self._log.i(f"get_tracks: modules_folder = {self._modules_folder}")
 
-        if module_ids is None:
-            module_ids = [_dir.name for _dir in sorted(self._modules_folder.glob("[!.]*/"))]
-
-        for module_id in module_ids:
-            track_json = self.get_track(module_id)
+        self._snapshot.scan(module_ids)
+        for module in self._snapshot.modules:
+            track_json = self._get_from_snapshot(module)
             if track_json is not None:
                 self._tracks.append(track_json)
 
@@ -82,6 +78,10 @@ class LocalTracks(BaseTracks):
     def tracks(self):
         return self._tracks
 
+    @property
+    def snapshot(self):
+        return self._snapshot
+
     @classmethod
     def add_track(cls, track, modules_folder, cover=True):
         module_folder = modules_folder.joinpath(track.id)
@@ -103,6 +103,7 @@ class LocalTracks(BaseTracks):
     def del_track(cls, module_id, modules_folder):
         module_folder = modules_folder.joinpath(module_id)
         shutil.rmtree(module_folder, ignore_errors=True)
+        TrackJson.clear_cache(module_folder.joinpath(TrackJson.filename()))
 
     @classmethod
     def update_track(cls, track, modules_folder):
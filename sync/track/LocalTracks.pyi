@@ -2,7 +2,7 @@ from pathlib import Path
 from typing import Optional, List
 
 from .BaseTracks import BaseTracks
-from ..error import Result
+from .RepoSnapshot import RepoSnapshot, ModuleSnapshot
 from ..model import TrackJson, ConfigJson
 from ..utils import Log
 
@@ -10,11 +10,11 @@ from ..utils import Log
 class LocalTracks(BaseTracks):
     _log: Log
     _modules_folder: Path
+    _snapshot: RepoSnapshot
     _tracks: List[TrackJson]
 
     def __init__(self, modules_folder: Path, config: ConfigJson): ...
-    @Result.catching()
-    def _get_from_file(self, file: Path) -> Result: ...
+    def _get_from_snapshot(self, module: ModuleSnapshot) -> Optional[TrackJson]: ...
     def get_track(self, module_id: str) -> Optional[TrackJson]: ...
     def get_tracks(self, module_ids: Optional[List[str]] = ...) -> List[TrackJson]: ...
     def get_tracks_table(self) -> str: ...
@@ -22,6 +22,8 @@ class LocalTracks(BaseTracks):
     def size(self) -> int: ...
     @property
     def tracks(self) -> List[TrackJson]: ...
+    @property
+    def snapshot(self) -> RepoSnapshot: ...
     @classmethod
     def add_track(cls, track: TrackJson, modules_folder: Path, cover: bool = ...): ...
     @classmethod
@@ -0,0 +1,117 @@
+import errno
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from ..error import Result
+from ..model import TrackJson, UpdateJson
+
+
+class ModuleSnapshot:
+    def __init__(self, module_folder, shallow=False):
+        self.id = module_folder.name
+        self.folder = module_folder
+        self.files = dict()
+
+        self._track = None
+        self._update_json = None
+
+        if shallow:
+            return
+
+        try:
+            with os.scandir(module_folder) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        self.files[entry.name] = entry.stat()
+        except FileNotFoundError:
+            pass
+
+        self._track = self._load(TrackJson)
+
+    def _load(self, cls):
+        file = self.folder.joinpath(cls.filename())
+        if not self.exists(file.name):
+            error = FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(file))
+            return Result(error=error)
+
+        @Result.catching()
+        def load():
+            return cls.load(file)
+
+        return load()
+
+    def exists(self, name):
+        return name in self.files
+
+    def stat(self, name):
+        return self.files.get(name)
+
+    @property
+    def track(self):
+        return self._track
+
+    @property
+    def update_json(self):
+        if not self.exists(UpdateJson.filename()):
+            return None
+
+        # loaded on first use, listing tracks does not need it
+        if self._update_json is None:
+            self._update_json = self._load(UpdateJson)
+
+        if self._update_json.is_failure:
+            raise self._update_json.error
+
+        return self._update_json.value
+
+
+class RepoSnapshot:
+    def __init__(self, modules_folder):
+        self._modules_folder = modules_folder
+        self._modules = dict()
+
+    def _get_module_ids(self):
+        if not self._modules_folder.exists():
+            return list()
+
+        with os.scandir(self._modules_folder) as entries:
+            module_ids = [
+                entry.name for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            ]
+
+        return sorted(module_ids)
+
+    def scan(self, module_ids=None, *, shallow=False, max_workers=None):
+        if module_ids is None:
+            module_ids = self._get_module_ids()
+
+        # stat calls and json loading are slow on network filesystems
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            modules = executor.map(
+                lambda module_id: ModuleSnapshot(self._modules_folder.joinpath(module_id), shallow),
+                module_ids
+            )
+
+            self._modules = {module.id: module for module in modules}
+
+        return self
+
+    def update(self, module_id):
+        module = ModuleSnapshot(self._modules_folder.joinpath(module_id))
+        self._modules[module_id] = module
+        return module
+
+    def remove(self, module_id):
+        self._modules.pop(module_id, None)
+
+    def get(self, module_id):
+        return self._modules.get(module_id)
+
+    @property
+    def modules(self):
+        return list(self._modules.values())
+
+    @property
+    def size(self):
+        return self._modules.__len__()
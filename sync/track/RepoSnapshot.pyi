@@ -0,0 +1,46 @@
+import os
+from pathlib import Path
+from typing import Optional, List, Dict, Type, Union
+
+from ..error import Result
+from ..model import TrackJson, UpdateJson
+
+
+class ModuleSnapshot:
+    id: str
+    folder: Path
+    files: Dict[str, os.stat_result]
+
+    _track: Optional[Result]
+    _update_json: Optional[Result]
+
+    def __init__(self, module_folder: Path, shallow: bool = ...): ...
+    def _load(self, cls: Union[Type[TrackJson], Type[UpdateJson]]) -> Result: ...
+    def exists(self, name: str) -> bool: ...
+    def stat(self, name: str) -> Optional[os.stat_result]: ...
+    @property
+    def track(self) -> Optional[Result]: ...
+    @property
+    def update_json(self) -> Optional[UpdateJson]: ...
+
+
+class RepoSnapshot:
+    _modules_folder: Path
+    _modules: Dict[str, ModuleSnapshot]
+
+    def __init__(self, modules_folder: Path): ...
+    def _get_module_ids(self) -> List[str]: ...
+    def scan(
+        self,
+        module_ids: Optional[List[str]] = ...,
+        *,
+        shallow: bool = ...,
+        max_workers: Optional[int] = ...
+    ) -> RepoSnapshot: ...
+    def update(self, module_id: str) -> ModuleSnapshot: ...
+    def remove(self, module_id: str): ...
+    def get(self, module_id: str) -> Optional[ModuleSnapshot]: ...
+    @property
+    def modules(self) -> List[ModuleSnapshot]: ...
+    @property
+    def size(self) -> int: ...
@@ -1,5 +1,6 @@
 from .BaseTracks import BaseTracks
 from .LocalTracks import LocalTracks
+from .RepoSnapshot import RepoSnapshot, ModuleSnapshot
 
 try:
     from .GithubTracks import GithubTracks
@@ -10,5 +11,7 @@ except ImportError:
 __all__ = [
     "BaseTracks",
     "GithubTracks",
-    "LocalTracks"
+    "LocalTracks",
+    "ModuleSnapshot",
+    "RepoSnapshot"
 ]
@@ -1,55 +1,137 @@
-from datetime import datetime
-from typing import Optional, List
+import json
+from typing import Optional, List, Dict, Any
 
-import requests
-from dateutil.parser import parse
+from requests import HTTPError, Response
+
+from .HttpUtils import HttpUtils
+from .RateLimiter import RateLimiter
+from ..error import GraphQLError, Result
 
 
 class GitHubGraphQLAPI:
-    def __init__(self, api_token: str):
+    _api_url = "https://api.github.com/graphql"
+    _rate_limit_field = "rateLimit { limit cost remaining resetAt }"
+    _repository_fields = """
+        name
+        owner { login }
+        url
+        sshUrl
+        pushedAt
+        homepageUrl
+        hasIssuesEnabled
+        defaultBranchRef { name }
+        licenseInfo { spdxId }
+        fundingLinks { platform url }
+        moduleProp: object(expression: "HEAD:module.prop") { id }
+        updateBinary: object(expression: "HEAD:META-INF/com/google/android/update-binary") { id }
+        updaterScript: object(expression: "HEAD:META-INF/com/google/android/updater-script") { id }
+        updateJson: object(expression: "HEAD:update.json") { id }
+        changelog: object(expression: "HEAD:changelog.md") { id }
+    """
+
+    _pushed_at_fields = """
+        name
+        owner { login }
+        pushedAt
+    """
+
+    def __init__(self, api_token: str, *, rate_limiter: Optional[RateLimiter] = None):
         self._api_token = api_token
 
+        if rate_limiter is None:
+            rate_limiter = RateLimiter("graphql")
+        self._rate_limiter = rate_limiter
+
+    @classmethod
+    def _is_limited(cls, response: Response) -> bool:
+        if RateLimiter.is_limited(response):
+            return True
+
+        # the primary rate limit of GraphQL is reported in the body
+        if response.ok:
+            errors = response.json().get("errors") or list()
+            return any(error.get("type") == "RATE_LIMITED" for error in errors)
+
+        return False
+
     def _graphql_query(self, query: str) -> Optional[dict]:
         query = {"query": query}
 
-        response = requests.post(
-            url="https://api.github.com/graphql",
-            headers={
-                "Authorization": f"bearer {self._api_token}",
-                "Content-Type": "application/json",
-            },
-            json=query
+        response = self._rate_limiter.request(
+            lambda: HttpUtils.get_session().post(
+                url=self._api_url,
+                headers={
+                    "Authorization": f"bearer {self._api_token}",
+                    "Content-Type": "application/json",
+                },
+                json=query
+            ),
+            is_limited=self._is_limited
         )
 
-        if response.ok:
-            return response.json()
-        else:
-            return None
-
-    def _query_repository(self, owner: str, name: str, query: str) -> Optional[dict]:
-        params = "owner: \"{}\", name: \"{}\"".format(owner, name)
-        _query = "query { repository(%s) { %s } }" % (params, query)
+        if not response.ok:
+            raise HTTPError(f"{response.status_code} {response.reason}: {response.text}")
+
+        result = response.json()
+        data = result.get("data") or dict()
+        self._rate_limiter.update_graphql(data.get("rateLimit"))
+
+        errors = result.get("errors") or list()
+        if any(error.get("type") == "RATE_LIMITED" for error in errors):
+            raise GraphQLError(f"rate limited after retries: {self.get_error_msg(errors[0])}")
+
+        # the whole query failed, not only some fields
+        if len(errors) != 0 and result.get("data") is None:
+            raise GraphQLError("; ".join(self.get_error_msg(error) for error in errors))
+
+        return result
+
+    @classmethod
+    def get_error_msg(cls, error: Dict[str, Any]) -> str:
+        return f"{error.get('type', 'ERROR')}: {error.get('message')}"
+
+    def get_repositories(
+        self,
+        owner: str,
+        names: List[str],
+        *,
+        shallow: bool = False
+    ) -> Dict[str, Result]:
+        # one aliased query for all repositories, missing ones are null
+        aliases = [
+            "r%d: repository(owner: %s, name: %s) { ...RepositoryFields }" % (
+                index, json.dumps(owner), json.dumps(name)
+            )
+            for index, name in enumerate(names)
+        ]
+        _query = "query { %s %s } fragment RepositoryFields on Repository { %s }" % (
+            self._rate_limit_field,
+            " ".join(aliases),
+            self._pushed_at_fields if shallow else self._repository_fields
+        )
         result = self._graphql_query(_query)
+        data = result.get("data") or dict()
+
+        # errors of a repository are reported by the path of its alias
+        errors = dict()
+        for error in result.get("errors") or list():
+            path = error.get("path") or list()
+            if len(path) != 0 and error.get("type") != "NOT_FOUND":
+                errors.setdefault(path[0], error)
+
+        repositories = dict()
+        for index, name in enumerate(names):
+            alias = f"r{index}"
+            if alias in errors:
+                repositories[name] = Result(error=GraphQLError(self.get_error_msg(errors[alias])))
+            else:
+                repositories[name] = Result(value=data.get(alias))
 
-        try:
-            data = result.get("data")
-            repository = data.get("repository")
-            return repository
-        except AttributeError:
-            return None
-
-    def get_sponsor_url(self, owner: str, name: str) -> List[str]:
-        repository = self._query_repository(
-            owner=owner,
-            name=name,
-            query="fundingLinks { platform url }"
-        )
-        if repository is None:
-            return list()
+        return repositories
 
+    @classmethod
+    def get_sponsor_urls(cls, funding_links: List[Dict[str, str]]) -> List[str]:
         links = list()
-        funding_links = repository["fundingLinks"]
-
         for item in funding_links:
             if item["platform"] == "GITHUB":
                 name = item["url"].split("/")[-1]
@@ -59,31 +141,6 @@ class GitHubGraphQLAPI:
 
         return links
 
-    def get_homepage_url(self, owner: str, name: str) -> Optional[str]:
-        repository = self._query_repository(
-            owner=owner,
-            name=name,
-            query="homepageUrl"
-        )
-        if repository is None:
-            return None
-
-        homepage_url = repository["homepageUrl"]
-        if homepage_url != "":
-            return homepage_url
-        else:
-            return None
-
-    def get_pushed_at(self, owner: str, name: str) -> Optional[datetime]:
-        repository = self._query_repository(
-            owner=owner,
-            name=name,
-            query="pushedAt"
-        )
-        if repository is None:
-            return None
-
-        try:
-            return parse(repository["pushedAt"])
-        except TypeError:
-            return None
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
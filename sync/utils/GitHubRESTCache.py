@@ -0,0 +1,94 @@
+import threading
+from pathlib import Path
+from typing import Optional
+
+import requests
+from github.Requester import Requester, HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+
+from .HttpCache import HttpCache
+
+
+class _CacheAdapter(HTTPAdapter):
+    # pagination of PyGithub depends on 'Link'
+    _keep_headers = ["Link", "Content-Type"]
+
+    def __init__(self, cache: HttpCache, **kwargs):
+        super().__init__(**kwargs)
+        self._cache = cache
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        is_conditional = "If-None-Match" in request.headers or "If-Modified-Since" in request.headers
+        if request.method != "GET" or is_conditional:
+            return super().send(request, **kwargs)
+
+        url = request.url
+        meta = self._cache.get_meta(url)
+        content = self._cache.load(url) if meta is not None else None
+        if content is not None:
+            request.headers.update(self._cache.get_headers(url))
+
+        response = super().send(request, **kwargs)
+
+        # not counted against the rate limit of GitHub
+        if response.status_code == 304 and content is not None:
+            response.status_code = 200
+            response.reason = "OK"
+            response._content = content
+            response.headers.update(meta.get("headers") or dict())
+
+        elif response.status_code == 200:
+            self._cache.save(url, response.headers, response.content, keep_headers=self._keep_headers)
+
+        return response
+
+
+class _HTTPSConnection(HTTPSRequestsConnectionClass):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.session.close()
+        self.session = GitHubRESTCache.get_session(self.retry, self.pool_size)
+
+    def close(self):
+        # the session is shared by all connections
+        pass
+
+
+class GitHubRESTCache:
+    _cache: Optional[HttpCache] = None
+    _session: Optional[Session] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls, retry, pool_size: int) -> Session:
+        with cls._lock:
+            if cls._session is None:
+                adapter = _CacheAdapter(
+                    cls._cache,
+                    max_retries=retry,
+                    pool_connections=pool_size,
+                    pool_maxsize=pool_size
+                )
+
+                session = requests.Session()
+                session.auth = Requester.noopAuth
+                session.mount("https://", adapter)
+                cls._session = session
+
+            return cls._session
+
+    @classmethod
+    def set_cache_folder(cls, cache_folder: Optional[Path]):
+        with cls._lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
+            if cache_folder is None:
+                cls._cache = None
+                Requester.resetConnectionClasses()
+            else:
+                cls._cache = HttpCache(cache_folder.joinpath("github"))
+                Requester.injectConnectionClasses(HTTPRequestsConnectionClass, _HTTPSConnection)
@@ -1,13 +1,27 @@
 import functools
-import os
+import hashlib
 import shutil
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, List, Any
 
-from git import Repo, InvalidGitRepositoryError, GitCommandError
+from git import Git, Repo, InvalidGitRepositoryError, GitCommandError, NoSuchPathError
+
+from .ZipUtils import ZipUtils
 
 
 class GitUtils:
+    _cache_folder: Optional[Path] = None
+    _locks: Dict[str, threading.Lock] = dict()
+    _lock = threading.Lock()
+
+    _clone_options: Dict[str, Dict[str, Any]] = {
+        "full": dict(),
+        "single": dict(single_branch=True),
+        "shallow": dict(depth=1, single_branch=True),
+        "partial": dict(filter="blob:none", single_branch=True)
+    }
+
     @classmethod
     @functools.lru_cache()
     def current_branch(cls, repo_dir: Path) -> Optional[str]:
@@ -17,14 +31,149 @@ class GitUtils:
             return None
 
     @classmethod
-    def clone_and_zip(cls, url: str, out: Path) -> float:
+    def get_remote_head(cls, url: str) -> Optional[str]:
+        try:
+            output = Git().ls_remote(url, "HEAD")
+        except GitCommandError:
+            return None
+
+        for line in output.splitlines():
+            values = line.split("\t")
+            if len(values) == 2 and values[1] == "HEAD":
+                return values[0]
+
+        return None
+
+    @classmethod
+    def set_cache_folder(cls, cache_folder: Optional[Path]):
+        if cache_folder is None:
+            cls._cache_folder = None
+        else:
+            cls._cache_folder = cache_folder.joinpath("git")
+
+    @classmethod
+    def _get_lock(cls, key: str) -> threading.Lock:
+        with cls._lock:
+            return cls._locks.setdefault(key, threading.Lock())
+
+    @classmethod
+    def clone_strategies(cls) -> List[str]:
+        return list(cls._clone_options.keys())
+
+    @classmethod
+    def _get_options(cls, strategy: str) -> Dict[str, Any]:
+        options = cls._clone_options.get(strategy)
+        if options is None:
+            raise ValueError(f"unsupported clone strategy: {strategy}")
+
+        return options.copy()
+
+    @classmethod
+    def _get_mirror_dir(cls, url: str, strategy: str) -> Path:
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        if strategy != "full":
+            name = f"{name}_{strategy}"
+
+        return cls._cache_folder.joinpath(f"{name}.git")
+
+    @classmethod
+    def fetch_mirror(cls, url: str, strategy: str = "full") -> Optional[Repo]:
+        if cls._cache_folder is None:
+            return None
+
+        options = cls._get_options(strategy)
+        refspecs = ["+HEAD:refs/heads/latest"]
+        if not options.pop("single_branch", False):
+            # like a clone without --single-branch, all branches of remote are kept
+            refspecs.append("+refs/heads/*:refs/remotes/origin/*")
+
+        mirror_dir = cls._get_mirror_dir(url, strategy)
+
+        with cls._get_lock(mirror_dir.name):
+            if mirror_dir.exists() and not cls._is_valid_mirror(mirror_dir):
+                shutil.rmtree(mirror_dir, ignore_errors=True)
+
+            is_new = not mirror_dir.exists()
+            if is_new:
+                repo = Repo.init(mirror_dir, bare=True, mkdir=True)
+                repo.create_remote("origin", url)
+                repo.git.symbolic_ref("HEAD", "refs/heads/latest")
+            else:
+                repo = Repo(mirror_dir)
+
+            try:
+                # the archive is made from the default branch of remote
+                repo.git.fetch("origin", *refspecs, no_tags=True, **options)
+                return repo
+
+            except GitCommandError:
+                # keep the objects of an existing mirror, a network error is usually transient
+                if is_new or not cls._is_valid_mirror(mirror_dir):
+                    shutil.rmtree(mirror_dir, ignore_errors=True)
+                raise
+
+    @classmethod
+    def _is_valid_mirror(cls, mirror_dir: Path) -> bool:
+        try:
+            repo = Repo(mirror_dir)
+            if not repo.bare:
+                return False
+
+            repo.git.rev_parse("--verify", "refs/heads/latest^{commit}")
+            return True
+        except (InvalidGitRepositoryError, NoSuchPathError, GitCommandError):
+            return False
+
+    @classmethod
+    def read_file(cls, repo: Repo, path: str, rev: str = "HEAD") -> Optional[str]:
+        try:
+            return repo.git.show(f"{rev}:{path}")
+        except GitCommandError:
+            return None
+
+    @classmethod
+    def _checkout(cls, mirror: Repo, repo_dir: Path) -> float:
+        repo_dir.mkdir(parents=True)
+        index_file = repo_dir.with_name(f"{repo_dir.name}.index")
+
+        # materialise the working tree from the local mirror, missing blobs
+        # of a partial mirror are fetched on demand
+        try:
+            with mirror.git.custom_environment(
+                GIT_WORK_TREE=repo_dir.as_posix(),
+                GIT_INDEX_FILE=index_file.as_posix()
+            ):
+                mirror.git.checkout("-f", "HEAD", "--", ".")
+        finally:
+            index_file.unlink(missing_ok=True)
+
+        return float(mirror.commit().committed_date)
+
+    @classmethod
+    def _clone(cls, url: str, repo_dir: Path, mirror: Optional[Repo], strategy: str) -> float:
+        if mirror is None:
+            mirror = cls.fetch_mirror(url, strategy)
+
+        if mirror is None:
+            repo = Repo.clone_from(url, repo_dir, **cls._get_options(strategy))
+            return float(repo.commit().committed_date)
+
+        return cls._checkout(mirror, repo_dir)
+
+    @classmethod
+    def clone_and_zip(
+        cls,
+        url: str,
+        out: Path,
+        mirror: Optional[Repo] = None,
+        strategy: str = "full"
+    ) -> float:
         repo_dir = out.with_suffix("")
         if repo_dir.exists():
             shutil.rmtree(repo_dir)
 
         try:
-            repo = Repo.clone_from(url, repo_dir)
-            last_committed = float(repo.commit().committed_date)
+            last_committed = cls._clone(url, repo_dir, mirror, strategy)
         except GitCommandError:
             shutil.rmtree(repo_dir, ignore_errors=True)
             raise GitCommandError(f"clone failed: {url}")
@@ -36,12 +185,8 @@ class GitUtils:
                 if path.is_file():
                     path.unlink(missing_ok=True)
 
-                continue
-
-            os.utime(path, (last_committed, last_committed))
-
         try:
-            shutil.make_archive(repo_dir.as_posix(), format="zip", root_dir=repo_dir)
+            ZipUtils.make_archive(repo_dir, out, last_committed)
             shutil.rmtree(repo_dir)
         except FileNotFoundError:
             raise FileNotFoundError(f"archive failed: {repo_dir.as_posix()}")
@@ -0,0 +1,75 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Tuple, Sequence
+
+
+class HttpCache:
+    def __init__(self, cache_folder: Path):
+        self._cache_folder = cache_folder
+
+    @classmethod
+    def _write_bytes(cls, file: Path, content: bytes):
+        tmp = file.with_name(f"{file.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, file)
+
+    def _get_files(self, url: str) -> Tuple[Path, Path]:
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self._cache_folder.joinpath(f"{name}.json"), self._cache_folder.joinpath(name)
+
+    def get_meta(self, url: str) -> Optional[Dict[str, str]]:
+        meta_file, body_file = self._get_files(url)
+        if not (meta_file.exists() and body_file.exists()):
+            return None
+
+        try:
+            meta = json.loads(meta_file.read_text())
+        except ValueError:
+            return None
+
+        if meta.get("url") != url:
+            return None
+
+        return meta
+
+    def get_headers(self, url: str) -> Dict[str, str]:
+        meta = self.get_meta(url)
+        if meta is None:
+            return dict()
+
+        headers = dict()
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        return headers
+
+    def load(self, url: str) -> Optional[bytes]:
+        _, body_file = self._get_files(url)
+        try:
+            return body_file.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def save(self, url: str, headers: Dict[str, str], content: bytes, *, keep_headers: Sequence[str] = ()):
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return
+
+        self._cache_folder.mkdir(parents=True, exist_ok=True)
+        meta_file, body_file = self._get_files(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified
+        }
+        if len(keep_headers) != 0:
+            meta["headers"] = {key: headers[key] for key in keep_headers if key in headers}
+
+        self._write_bytes(body_file, content)
+        self._write_bytes(meta_file, json.dumps(meta, indent=2).encode("utf-8"))
@@ -1,57 +1,242 @@
-import json
-import re
+import os
+import struct
+import threading
+import zipfile
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Union
+from typing import Union, Optional, Tuple
 
 import requests
 from dateutil.parser import parse
-from requests import HTTPError
+from requests import HTTPError, Response, Session
+from requests.adapters import HTTPAdapter
 
+from .HttpCache import HttpCache
+from .JsonUtils import JsonUtils
+from ..error import OversizeError
 from .StrUtils import StrUtils
 
 
 class HttpUtils:
+    _cache: Optional[HttpCache] = None
+    _session: Optional[Session] = None
+    _pool_size: int = 10
+    _lock = threading.Lock()
+
     @classmethod
-    def _filter_json(cls, text: str) -> str:
-        return re.sub(r",(?=\s*?[}\]])", "", text)
+    def _get_cache(cls, use_cache: bool) -> Optional[HttpCache]:
+        if use_cache:
+            return cls._cache
+        else:
+            return None
 
     @classmethod
-    def load_json(cls, url: str) -> Union[list, dict]:
-        response = requests.get(url, stream=True)
-        if not response.ok:
-            if StrUtils.is_html(response.text):
-                msg = "404 not found"
-            else:
-                msg = response.text
-            raise HTTPError(msg)
+    def _get(cls, url: str, cache: Optional[HttpCache]) -> Response:
+        headers = dict()
+        if cache is not None:
+            headers.update(cache.get_headers(url))
 
-        text = cls._filter_json(response.text)
-        obj = json.loads(text)
+        return cls.get_session().get(url, headers=headers, stream=True)
 
+    @classmethod
+    def _get_timestamp(cls, last_modified: Optional[str]) -> float:
+        if last_modified is not None:
+            return parse(last_modified).timestamp()
+        else:
+            return datetime.now().timestamp()
+
+    @classmethod
+    def _raise_error(cls, response: Response):
+        if StrUtils.is_html(response.text):
+            msg = "404 not found"
+        else:
+            msg = response.text
+        raise HTTPError(msg)
+
+    @classmethod
+    def get_session(cls) -> Session:
+        with cls._lock:
+            if cls._session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=cls._pool_size,
+                    pool_maxsize=cls._pool_size
+                )
+
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                cls._session = session
+
+            return cls._session
+
+    @classmethod
+    def set_pool_size(cls, max_workers: Optional[int]):
+        if max_workers is None:
+            # same as the default of ThreadPoolExecutor
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+        with cls._lock:
+            if max_workers == cls._pool_size:
+                return
+
+            cls._pool_size = max_workers
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
+    @classmethod
+    def set_cache_folder(cls, cache_folder: Optional[Path]):
+        if cache_folder is None:
+            cls._cache = None
+        else:
+            cls._cache = HttpCache(cache_folder.joinpath("http"))
+
+    @classmethod
+    def load_json(cls, url: str, *, use_cache: bool = True) -> Union[list, dict]:
+        cache = cls._get_cache(use_cache)
+        response = cls._get(url, cache)
+
+        if response.status_code == 304 and cache is not None:
+            text = cache.load(url).decode("utf-8")
+        elif not response.ok:
+            cls._raise_error(response)
+        else:
+            text = response.text
+            if cache is not None:
+                cache.save(url, response.headers, response.content)
+
+        obj = JsonUtils.loads(text)
         return obj
 
     @classmethod
-    def download(cls, url: str, out: Path) -> float:
+    def download(
+        cls,
+        url: str,
+        out: Path,
+        *,
+        use_cache: bool = False,
+        max_size: Optional[int] = None
+    ) -> float:
         out.parent.mkdir(parents=True, exist_ok=True)
 
-        response = requests.get(url, stream=True)
-        if response.status_code == 200:
+        cache = cls._get_cache(use_cache)
+        response = cls._get(url, cache)
+
+        if response.status_code == 304 and cache is not None:
+            out.write_bytes(cache.load(url))
+            meta = cache.get_meta(url)
+            return cls._get_timestamp(meta.get("last_modified"))
+
+        elif response.status_code == 200:
+            content_length = response.headers.get("Content-Length", "")
+            if max_size is not None and content_length.isdigit() and int(content_length) > max_size:
+                response.close()
+                raise OversizeError(f"content length {content_length} is larger than {max_size}")
+
+            size = 0
             block_size = 1024
             with open(out, 'wb') as file:
                 for data in response.iter_content(block_size):
+                    size += len(data)
+                    if max_size is not None and size > max_size:
+                        break
+
                     file.write(data)
 
-            if "Last-Modified" in response.headers:
-                last_modified = response.headers["Last-Modified"]
-                return parse(last_modified).timestamp()
-            else:
-                return datetime.now().timestamp()
+            if max_size is not None and size > max_size:
+                response.close()
+                out.unlink(missing_ok=True)
+                raise OversizeError(f"downloaded size is larger than {max_size}")
+
+            if cache is not None:
+                cache.save(url, response.headers, out.read_bytes())
+
+            return cls._get_timestamp(response.headers.get("Last-Modified"))
+
         else:
             out.unlink(missing_ok=True)
+            cls._raise_error(response)
+
+    @classmethod
+    def _get_range(cls, url: str, start: int, end: Optional[int] = None) -> Optional[Tuple[bytes, int]]:
+        if start < 0:
+            value = f"bytes={start}"
+        else:
+            value = f"bytes={start}-{'' if end is None else end}"
+
+        response = cls.get_session().get(url, headers={"Range": value}, stream=True)
+        content_range = response.headers.get("Content-Range", "")
+
+        # the server ignores 'Range', do not read the whole body
+        if response.status_code != 206 or "/" not in content_range:
+            response.close()
+            return None
+
+        total = content_range.split("/")[-1]
+        return response.content, int(total) if total.isdigit() else -1
+
+    @classmethod
+    def read_zip_file(cls, url: str, name: str) -> Optional[bytes]:
+        # End of central directory record (22 bytes) + max comment length
+        result = cls._get_range(url, -(22 + 0xFFFF))
+        if result is None:
+            return None
 
-            if StrUtils.is_html(response.text):
-                msg = "404 not found"
-            else:
-                msg = response.text
-            raise HTTPError(msg)
+        tail, total = result
+        eocd_start = tail.rfind(b"PK\x05\x06")
+        if eocd_start == -1 or total == -1:
+            return None
+
+        cd_size, cd_offset = struct.unpack("<LL", tail[eocd_start + 12:eocd_start + 20])
+        if cd_size == 0xFFFFFFFF or cd_offset == 0xFFFFFFFF:
+            # zip64 is not supported here
+            return None
+
+        tail_offset = total - len(tail)
+        if cd_offset >= tail_offset:
+            cd = tail[cd_offset - tail_offset:cd_offset - tail_offset + cd_size]
+        else:
+            result = cls._get_range(url, cd_offset, cd_offset + cd_size - 1)
+            if result is None:
+                return None
+            cd, _ = result
+
+        entry = None
+        pos = 0
+        while pos + 46 <= len(cd) and cd[pos:pos + 4] == b"PK\x01\x02":
+            (
+                method, compressed_size, name_len, extra_len, comment_len, header_offset
+            ) = struct.unpack("<10xH8xL4xHHH8xL", cd[pos:pos + 46])
+
+            entry_name = cd[pos + 46:pos + 46 + name_len].decode("utf-8", errors="replace")
+            if entry_name == name:
+                entry = (method, compressed_size, header_offset)
+                break
+
+            pos += 46 + name_len + extra_len + comment_len
+
+        if entry is None:
+            raise FileNotFoundError(f"there is no item named '{name}' in the archive")
+
+        method, compressed_size, header_offset = entry
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            return None
+
+        # extra field of local file header may differ from central directory
+        end = header_offset + 30 + len(name.encode("utf-8")) + compressed_size + 1024
+        result = cls._get_range(url, header_offset, min(end, total) - 1)
+        if result is None:
+            return None
+
+        local, _ = result
+        name_len, extra_len = struct.unpack("<HH", local[26:30])
+        data_start = 30 + name_len + extra_len
+        data = local[data_start:data_start + compressed_size]
+        if len(data) != compressed_size:
+            return None
+
+        if method == zipfile.ZIP_DEFLATED:
+            return zlib.decompressobj(-zlib.MAX_WBITS).decompress(data)
+        else:
+            return data
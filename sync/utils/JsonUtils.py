@@ -0,0 +1,37 @@
+import json
+import re
+from typing import Union, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonUtils:
+    # strings are matched first, so that commas inside them are kept
+    _trailing_comma = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*")|,(?=\s*[}\]])', re.DOTALL)
+
+    @classmethod
+    def filter(cls, text: str) -> str:
+        return cls._trailing_comma.sub(r"\1", text)
+
+    @classmethod
+    def _loads(cls, text: Union[str, bytes]) -> Any:
+        if orjson is not None:
+            return orjson.loads(text)
+
+        return json.loads(text)
+
+    @classmethod
+    def loads(cls, text: Union[str, bytes]) -> Any:
+        try:
+            return cls._loads(text)
+        except ValueError:
+            pass
+
+        # trailing commas are not allowed in strict mode
+        if isinstance(text, bytes):
+            text = text.decode("utf-8")
+
+        return json.loads(cls.filter(text))
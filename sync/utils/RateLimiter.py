@@ -0,0 +1,180 @@
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Callable, Mapping, Dict, Any
+
+from dateutil.parser import parse
+from requests import Response
+
+from .Log import Log
+
+
+class RateLimiter:
+    _max_retries: int = 5
+    _max_concurrency: int = 4
+    _base_delay: float = 1.0
+    _max_delay: float = 60.0
+    _low_watermark: float = 0.1
+
+    def __init__(self, name: str, *, log: Optional[Log] = None):
+        self._name = name
+        self._log = Log("RateLimiter") if log is None else log
+
+        self._lock = threading.Lock()
+        self._semaphore: Optional[threading.BoundedSemaphore] = None
+
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._next_slot: float = 0.0
+
+    def _get_interval(self, now: float) -> float:
+        if self._remaining is None or self._reset_at is None or self._reset_at <= now:
+            return 0.0
+
+        # spread the rest of the budget over the time left in this window
+        if self._limit is not None and 0 < self._remaining < self._limit * self._low_watermark:
+            return (self._reset_at - now) / self._remaining
+
+        return 0.0
+
+    def _is_exhausted(self, now: float) -> bool:
+        return (
+            self._remaining is not None
+            and self._remaining <= 0
+            and self._reset_at is not None
+            and self._reset_at > now
+        )
+
+    def _get_semaphore(self) -> threading.BoundedSemaphore:
+        # built on first use, so that set_max_concurrency is respected
+        with self._lock:
+            if self._semaphore is None:
+                self._semaphore = threading.BoundedSemaphore(self._max_concurrency)
+
+            return self._semaphore
+
+    def _wait(self):
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot)
+            if self._is_exhausted(now):
+                slot = max(slot, self._reset_at)
+
+            self._next_slot = slot + self._get_interval(now)
+
+        delay = slot - now
+        if delay > 0:
+            self._log.d(f"wait: [{self._name}] -> {delay:.2f}s")
+            time.sleep(delay)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]):
+        if retry_after is None:
+            # exponential with full jitter, so that threads do not retry in lockstep
+            delay = random.uniform(0, min(self._max_delay, self._base_delay * 2 ** attempt))
+        else:
+            delay = retry_after + random.uniform(0, self._base_delay)
+
+        # the limits apply to the token, so every thread has to back off
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.time() + delay)
+
+        self._log.w(f"backoff: [{self._name}] -> attempt {attempt + 1}, {delay:.2f}s")
+
+    def _get_retry_after(self, response: Response) -> Optional[float]:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = response.headers.get("X-RateLimit-Reset", "")
+            if reset.isdigit():
+                return max(0.0, int(reset) - time.time())
+
+        return None
+
+    @classmethod
+    def is_limited(cls, response: Response) -> bool:
+        if response.status_code == 429:
+            return True
+
+        if response.status_code == 403:
+            return (
+                "Retry-After" in response.headers
+                or response.headers.get("X-RateLimit-Remaining") == "0"
+                or "rate limit" in response.text.lower()
+            )
+
+        return False
+
+    def update(self, headers: Mapping[str, str]):
+        limit = headers.get("X-RateLimit-Limit", "")
+        remaining = headers.get("X-RateLimit-Remaining", "")
+        reset = headers.get("X-RateLimit-Reset", "")
+        if not (limit.isdigit() and remaining.isdigit() and reset.isdigit()):
+            return
+
+        self._set_budget(int(limit), int(remaining), float(reset))
+        self._log.d(f"update: [{self._name}] -> {self.budget}")
+
+    def update_graphql(self, rate_limit: Optional[Dict[str, Any]]):
+        if rate_limit is None:
+            return
+
+        reset_at = parse(rate_limit["resetAt"]).timestamp()
+        self._set_budget(rate_limit.get("limit"), rate_limit["remaining"], reset_at)
+        self._log.d(f"update_graphql: [{self._name}] -> cost {rate_limit.get('cost')}, {self.budget}")
+
+    def _set_budget(self, limit: Optional[int], remaining: int, reset_at: float):
+        with self._lock:
+            if limit is not None:
+                self._limit = limit
+
+            self._remaining = remaining
+            self._reset_at = reset_at
+
+    def request(
+        self,
+        send: Callable[[], Response],
+        is_limited: Optional[Callable[[Response], bool]] = None
+    ) -> Response:
+        if is_limited is None:
+            is_limited = self.is_limited
+
+        attempt = 0
+        while True:
+            with self._get_semaphore():
+                self._wait()
+                response = send()
+
+            self.update(response.headers)
+            if not is_limited(response) or attempt >= self._max_retries:
+                return response
+
+            self._backoff(attempt, self._get_retry_after(response))
+            attempt += 1
+
+    @property
+    def remaining(self) -> Optional[int]:
+        return self._remaining
+
+    @property
+    def budget(self) -> str:
+        if self._remaining is None:
+            return "remaining unknown"
+
+        if self._reset_at is None:
+            reset_at = "unknown"
+        else:
+            reset_at = datetime.fromtimestamp(self._reset_at).strftime("%H:%M:%S")
+
+        return f"remaining {self._remaining}/{self._limit}, reset at {reset_at}"
+
+    @classmethod
+    def set_max_retries(cls, value: int):
+        cls._max_retries = value
+
+    @classmethod
+    def set_max_concurrency(cls, value: int):
+        cls._max_concurrency = value
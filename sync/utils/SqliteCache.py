@@ -0,0 +1,56 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+
+class SqliteCache:
+    def __init__(self, file: Path, table: str):
+        file.parent.mkdir(parents=True, exist_ok=True)
+
+        self._table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(file, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(key TEXT PRIMARY KEY, stamp TEXT NOT NULL, value TEXT NOT NULL)"
+        )
+
+    def get(self, key: str, stamp: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT stamp, value FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        # the entry is out of date
+        if stamp is not None and row[0] != stamp:
+            return None
+
+        return json.loads(row[1])
+
+    def set(self, key: str, stamp: str, value: Dict[str, Any]):
+        with self._lock:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self._table} (key, stamp, value) VALUES (?, ?, ?)",
+                (key, stamp, json.dumps(value))
+            )
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            rows = self._connection.execute(f"SELECT key FROM {self._table}").fetchall()
+
+        return [row[0] for row in rows]
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
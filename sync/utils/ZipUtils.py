@@ -0,0 +1,319 @@
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from pathlib import Path
+from typing import List, Tuple, Optional, BinaryIO, Iterator, Deque
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+
+from ..error import OversizeError
+
+
+class ZipUtils:
+    _compress_level = 6
+    _min_date_time = (1980, 1, 1, 0, 0, 0)
+    _max_value = 0xFFFFFFFF
+    _max_count = 0xFFFF
+    _stream_size = 4 << 20
+    _chunk_size = 1 << 20
+
+    @classmethod
+    def set_compress_level(cls, value: int):
+        cls._compress_level = value
+
+    @classmethod
+    def _get_dos_date_time(cls, timestamp: float) -> Tuple[int, int]:
+        date_time = max(tuple(time.gmtime(timestamp)[:6]), cls._min_date_time)
+        year, month, day, hour, minute, second = date_time
+
+        dos_date = (year - 1980) << 9 | month << 5 | day
+        dos_time = hour << 11 | minute << 5 | second // 2
+        return dos_date, dos_time
+
+    @classmethod
+    def _list_files(cls, root_dir: Path) -> List[Tuple[str, Path]]:
+        files = list()
+        for dirpath, dirnames, filenames in os.walk(root_dir):
+            for name in dirnames:
+                path = Path(dirpath, name)
+                files.append((f"{path.relative_to(root_dir).as_posix()}/", path))
+
+            for name in filenames:
+                path = Path(dirpath, name)
+                files.append((path.relative_to(root_dir).as_posix(), path))
+
+        return sorted(files, key=lambda v: v[0])
+
+    @classmethod
+    def _get_mode(cls, path: Path) -> int:
+        if path.is_dir():
+            return 0o40755
+
+        if path.stat().st_mode & 0o111:
+            return 0o100755
+
+        return 0o100644
+
+    @classmethod
+    def _is_streamed(cls, path: Path) -> bool:
+        return path.is_file() and path.stat().st_size > cls._stream_size
+
+    @classmethod
+    def _compress(cls, path: Path, compress_level: int) -> Tuple[int, bytes, int, int, int]:
+        mode = cls._get_mode(path)
+        if path.is_dir():
+            return ZIP_STORED, b"", 0, 0, mode
+
+        data = path.read_bytes()
+        compressor = zlib.compressobj(compress_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        compressed = compressor.compress(data) + compressor.flush()
+
+        return ZIP_DEFLATED, compressed, zlib.crc32(data), len(data), mode
+
+    @classmethod
+    def _local_header(
+        cls,
+        raw_name: bytes,
+        flag_bits: int,
+        method: int,
+        date_time: Tuple[int, int],
+        crc: int,
+        compress_size: int,
+        size: int,
+        zip64: bool
+    ) -> bytes:
+        dos_date, dos_time = date_time
+        extra = b""
+        version = 20
+
+        if zip64:
+            extra = struct.pack("<2H2Q", 0x0001, 16, size, compress_size)
+            compress_size = size = 0xFFFFFFFF
+            version = 45
+
+        return struct.pack(
+            "<4s2B4HL2L2H",
+            b"PK\x03\x04", version, 0, flag_bits, method, dos_time, dos_date,
+            crc, compress_size, size, len(raw_name), len(extra)
+        ) + raw_name + extra
+
+    @classmethod
+    def _central_directory(
+        cls,
+        raw_name: bytes,
+        flag_bits: int,
+        method: int,
+        date_time: Tuple[int, int],
+        crc: int,
+        compress_size: int,
+        size: int,
+        mode: int,
+        offset: int
+    ) -> bytes:
+        dos_date, dos_time = date_time
+        external_attr = mode << 16
+        if method == ZIP_STORED:
+            # MS-DOS directory flag
+            external_attr |= 0x10
+
+        # the zip64 extra field only holds the values that do not fit, in this order
+        values = list()
+        if size >= cls._max_value:
+            values.append(size)
+            size = 0xFFFFFFFF
+        if compress_size >= cls._max_value:
+            values.append(compress_size)
+            compress_size = 0xFFFFFFFF
+        if offset >= cls._max_value:
+            values.append(offset)
+            offset = 0xFFFFFFFF
+
+        extra = b""
+        version = 20
+        if len(values) != 0:
+            extra = struct.pack(f"<2H{len(values)}Q", 0x0001, 8 * len(values), *values)
+            version = 45
+
+        return struct.pack(
+            "<4s4B4HL2L5H2L",
+            b"PK\x01\x02", version, 3, version, 0, flag_bits, method, dos_time, dos_date,
+            crc, compress_size, size, len(raw_name), len(extra), 0, 0, 0, external_attr, offset
+        ) + raw_name + extra
+
+    @classmethod
+    def _write_file(
+        cls,
+        file: BinaryIO,
+        name: str,
+        date_time: Tuple[int, int],
+        entry: Tuple[int, bytes, int, int, int]
+    ) -> bytes:
+        method, data, crc, size, mode = entry
+        offset = file.tell()
+
+        raw_name = name.encode("utf-8")
+        flag_bits = 0x800 if not name.isascii() else 0
+        zip64 = max(size, len(data)) >= cls._max_value
+
+        file.write(cls._local_header(raw_name, flag_bits, method, date_time, crc, len(data), size, zip64))
+        file.write(data)
+
+        return cls._central_directory(raw_name, flag_bits, method, date_time, crc, len(data), size, mode, offset)
+
+    @classmethod
+    def _write_stream(
+        cls,
+        file: BinaryIO,
+        name: str,
+        date_time: Tuple[int, int],
+        path: Path,
+        compress_level: int
+    ) -> bytes:
+        offset = file.tell()
+        mode = cls._get_mode(path)
+
+        raw_name = name.encode("utf-8")
+        flag_bits = 0x800 if not name.isascii() else 0
+        # the header is written before the sizes are known, deflate may grow incompressible data a little
+        zip64 = path.stat().st_size * 1.05 >= cls._max_value
+
+        file.write(cls._local_header(raw_name, flag_bits, ZIP_DEFLATED, date_time, 0, 0, 0, zip64))
+
+        crc, size, compress_size = 0, 0, 0
+        compressor = zlib.compressobj(compress_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        with open(path, "rb") as f:
+            while chunk := f.read(cls._chunk_size):
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                data = compressor.compress(chunk)
+                compress_size += len(data)
+                file.write(data)
+
+        data = compressor.flush()
+        compress_size += len(data)
+        file.write(data)
+
+        if not zip64 and max(size, compress_size) >= cls._max_value:
+            raise OversizeError(f"file grew while it was compressed: {name}")
+
+        end = file.tell()
+        file.seek(offset)
+        file.write(cls._local_header(raw_name, flag_bits, ZIP_DEFLATED, date_time, crc, compress_size, size, zip64))
+        file.seek(end)
+
+        return cls._central_directory(
+            raw_name, flag_bits, ZIP_DEFLATED, date_time, crc, compress_size, size, mode, offset
+        )
+
+    @classmethod
+    def _write_end(cls, file: BinaryIO, count: int, size: int, offset: int):
+        if count >= cls._max_count or size >= cls._max_value or offset >= cls._max_value:
+            zip64_offset = file.tell()
+            file.write(struct.pack(
+                "<4sQ2H2L4Q",
+                b"PK\x06\x06", 44, 45, 45, 0, 0, count, count, size, offset
+            ))
+            file.write(struct.pack(
+                "<4sLQL",
+                b"PK\x06\x07", 0, zip64_offset, 1
+            ))
+
+            count = min(count, 0xFFFF)
+            size = min(size, 0xFFFFFFFF)
+            offset = min(offset, 0xFFFFFFFF)
+
+        file.write(struct.pack(
+            "<4s4H2LH",
+            b"PK\x05\x06", 0, 0, count, count, size, offset, 0
+        ))
+
+    @classmethod
+    def _iter_entries(
+        cls,
+        executor: ThreadPoolExecutor,
+        files: List[Tuple[str, Path]],
+        compress_level: int,
+        window: int
+    ) -> Iterator[Tuple[str, Path, Optional[Future]]]:
+        pending: Deque[Tuple[str, Path, Optional[Future]]] = deque()
+
+        for name, path in files:
+            if cls._is_streamed(path):
+                # compressed while it is written, so that it is never held in memory
+                pending.append((name, path, None))
+            else:
+                pending.append((name, path, executor.submit(cls._compress, path, compress_level)))
+
+            if len(pending) >= window:
+                yield pending.popleft()
+
+        while len(pending) != 0:
+            yield pending.popleft()
+
+    @classmethod
+    def _write_archive(
+        cls,
+        file: BinaryIO,
+        entries: Iterator[Tuple[str, Path, Optional[Future]]],
+        date_time: Tuple[int, int],
+        compress_level: int
+    ):
+        central_directories = list()
+        for name, path, future in entries:
+            if future is None:
+                central_directory = cls._write_stream(file, name, date_time, path, compress_level)
+            else:
+                central_directory = cls._write_file(file, name, date_time, future.result())
+
+            central_directories.append(central_directory)
+
+        offset = file.tell()
+        for central_directory in central_directories:
+            file.write(central_directory)
+
+        cls._write_end(file, len(central_directories), file.tell() - offset, offset)
+
+    @classmethod
+    def test_archive(cls, file: Path) -> Optional[str]:
+        try:
+            with ZipFile(file, "r") as zipfile:
+                name = zipfile.testzip()
+        except Exception as err:
+            return str(err) or type(err).__name__
+
+        if name is not None:
+            return f"bad CRC-32 for file '{name}'"
+
+        return None
+
+    @classmethod
+    def make_archive(
+        cls,
+        root_dir: Path,
+        out: Path,
+        timestamp: float,
+        *,
+        compress_level: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ):
+        if compress_level is None:
+            compress_level = cls._compress_level
+
+        date_time = cls._get_dos_date_time(timestamp)
+        files = cls._list_files(root_dir)
+        max_workers = max_workers or os.cpu_count() or 1
+
+        # zlib releases the GIL, members are compressed in parallel and written in order,
+        # with at most two members per worker held in memory
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            entries = cls._iter_entries(executor, files, compress_level, max_workers * 2)
+
+            try:
+                with open(out, "wb") as file:
+                    cls._write_archive(file, entries, date_time, compress_level)
+            except BaseException:
+                entries.close()
+                out.unlink(missing_ok=True)
+                raise
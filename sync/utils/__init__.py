@@ -1,13 +1,23 @@
 from .GitHubGraphQLAPI import GitHubGraphQLAPI
 from .GitUtils import GitUtils
+from .HttpCache import HttpCache
 from .HttpUtils import HttpUtils
+from .JsonUtils import JsonUtils
 from .Log import Log
+from .RateLimiter import RateLimiter
+from .SqliteCache import SqliteCache
 from .StrUtils import StrUtils
+from .ZipUtils import ZipUtils
 
 __all__ = [
     "GitHubGraphQLAPI",
     "GitUtils",
+    "HttpCache",
     "HttpUtils",
+    "JsonUtils",
     "Log",
-    "StrUtils"
+    "RateLimiter",
+    "SqliteCache",
+    "StrUtils",
+    "ZipUtils"
 ]
@@ -0,0 +1,99 @@
+"""Compare HttpUtils.download on the shared session with requests.get per download.
+
+Usage: python tests/bench_HttpUtils.py [requests] [workers]
+
+Files are served by a local HTTP/1.1 server with keep-alive, which counts the
+connections it accepts; a small delay stands in for the TCP/TLS handshake.
+"""
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, Path(__file__).resolve().parents[1].as_posix())
+
+from sync.utils import HttpUtils  # noqa: E402
+
+BODY = bytes(64 << 10)
+HANDSHAKE = 0.005
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "Server"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+        time.sleep(HANDSHAKE)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.lock = threading.Lock()
+        self.connections = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/module.zip"
+
+
+def download_unpooled(url: str, out: Path):
+    response = requests.get(url, stream=True)
+    with open(out, "wb") as file:
+        for data in response.iter_content(1024):
+            file.write(data)
+
+
+def measure(name: str, server: Server, func, count: int, workers: int, tmp: Path):
+    server.connections = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda i: func(server.url, tmp.joinpath(f"{i % workers}.zip")), range(count)))
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<24} {elapsed:8.2f}s {server.connections:12}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    server = Server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    HttpUtils.set_pool_size(workers)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            print(f"{count} downloads, {workers} workers")
+            print(f"{'':<24} {'time':>9} {'connections':>12}")
+
+            measure("requests.get", server, download_unpooled, count, workers, tmp)
+            measure("HttpUtils.download", server, HttpUtils.download, count, workers, tmp)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
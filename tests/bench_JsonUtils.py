@@ -0,0 +1,82 @@
+"""Compare the JSON parsers behind JsonUtils.loads and the cost of the trailing-comma fallback.
+
+Usage: python tests/bench_JsonUtils.py [json_file] [rounds]
+
+Without json_file a modules.json with 2000 modules is generated.
+"""
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, Path(__file__).resolve().parents[1].as_posix())
+
+from sync.utils import JsonUtils  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def make_modules_json() -> str:
+    modules = list()
+    for i in range(2000):
+        modules.append({
+            "id": f"module_{i}",
+            "name": f"Module {i}, with a comma",
+            "version": f"v{i}",
+            "versionCode": i,
+            "author": "author",
+            "description": "a description, ] that looks like a trailing comma, }" * 4,
+            "track": {"type": "GIT", "added": 1690000000.0, "source": f"https://github.com/a/{i}.git"},
+            "versions": [
+                {
+                    "timestamp": 1690000000.0 + j,
+                    "version": f"v{j}",
+                    "versionCode": j,
+                    "zipUrl": f"https://example.com/modules/module_{i}/v{j}.zip",
+                    "changelog": f"https://example.com/modules/module_{i}/v{j}.md"
+                }
+                for j in range(3)
+            ]
+        })
+
+    return json.dumps({"name": "bench", "timestamp": 1690000000.0, "modules": modules}, indent=2)
+
+
+def add_trailing_commas(text: str) -> str:
+    return re.sub(r"\n(\s*[}\]])", r",\n\1", text)
+
+
+def measure(name: str, func, text, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(text)
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<32} {elapsed / rounds * 1000:8.2f}ms")
+
+
+def main():
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    if len(sys.argv) > 1:
+        text = Path(sys.argv[1]).read_text()
+    else:
+        text = make_modules_json()
+
+    with_commas = add_trailing_commas(text)
+    print(f"{len(text) / (1 << 20):.1f} MiB, {rounds} rounds, orjson {'installed' if orjson else 'not installed'}")
+
+    measure("json.loads", json.loads, text, rounds)
+    if orjson is not None:
+        measure("orjson.loads", orjson.loads, text, rounds)
+
+    measure("JsonUtils.loads", JsonUtils.loads, text, rounds)
+    measure("JsonUtils.filter", JsonUtils.filter, with_commas, rounds)
+    measure("JsonUtils.loads (commas)", JsonUtils.loads, with_commas, rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compare LocalModule._load with a load that decompresses every member it checks.
+
+Usage: python tests/bench_LocalModule.py [zip_file] [rounds]
+
+Without zip_file a module with a 4 MB update-binary is generated.
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from zipfile import ZipFile, ZIP_DEFLATED
+
+sys.path.insert(0, Path(__file__).resolve().parents[1].as_posix())
+
+from sync.model import LocalModule  # noqa: E402
+
+
+def make_module(file: Path):
+    with ZipFile(file, "w", ZIP_DEFLATED) as zipfile:
+        zipfile.writestr(
+            "module.prop",
+            "id=bench\nname=bench\nversion=v1\nversionCode=1\nauthor=bench\ndescription=bench\n"
+        )
+        zipfile.writestr("META-INF/com/google/android/update-binary", os.urandom(4 << 20))
+        zipfile.writestr("META-INF/com/google/android/updater-script", "#MAGISK\n")
+
+
+def load_full(file: Path):
+    # what LocalModule._load did before update-binary was checked by name
+    zipfile = ZipFile(file, "r")
+    if "#MAGISK" not in zipfile.read("META-INF/com/google/android/updater-script").decode("utf-8"):
+        raise ValueError(file.name)
+
+    zipfile.read("META-INF/com/google/android/update-binary")
+    props = zipfile.read("module.prop")
+    return LocalModule.parse_props(props.decode("utf-8"))
+
+
+def measure(name: str, func, file: Path, rounds: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(file)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<24} {elapsed / rounds * 1000:8.2f}ms {peak / (1 << 20):10.2f} MiB")
+
+
+def main():
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if len(sys.argv) > 1:
+            file = Path(sys.argv[1])
+        else:
+            file = Path(tmp, "module.zip")
+            make_module(file)
+
+        print(f"{file.name}, {file.stat().st_size / (1 << 20):.1f} MiB, {rounds} rounds")
+        print(f"{'':<24} {'per load':>10} {'peak memory':>14}")
+
+        measure("full read", load_full, file, rounds)
+        measure("LocalModule._load", LocalModule._load, file, rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare ZipUtils.make_archive with shutil.make_archive.
+
+Usage: python tests/bench_ZipUtils.py [root_dir]
+
+Without root_dir a synthetic module tree is generated (text, binaries and a large file).
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, Path(__file__).resolve().parents[1].as_posix())
+
+from sync.utils import ZipUtils  # noqa: E402
+
+
+def make_tree(root_dir: Path):
+    rand = random.Random(0)
+    words = [bytes(rand.choices(b"abcdefghijklmnopqrstuvwxyz", k=rand.randint(2, 9))) for _ in range(2000)]
+
+    for i in range(200):
+        path = root_dir.joinpath("system", f"dir{i % 20}", f"file{i}.sh")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b" ".join(rand.choices(words, k=20000)))
+
+    for i in range(20):
+        path = root_dir.joinpath("lib", f"lib{i}.so")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(os.urandom(1 << 20) + bytes(1 << 20))
+
+    root_dir.joinpath("large.img").write_bytes((os.urandom(1 << 20) + bytes(1 << 20)) * 32)
+
+
+def measure(name: str, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<24} {elapsed:8.2f}s {peak / (1 << 20):10.1f} MiB {out.stat().st_size / (1 << 20):10.1f} MiB")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        if len(sys.argv) > 1:
+            root_dir = Path(sys.argv[1])
+        else:
+            root_dir = tmp.joinpath("tree")
+            make_tree(root_dir)
+
+        print(f"cpu count: {os.cpu_count()}")
+        print(f"{'':<24} {'time':>9} {'peak memory':>14} {'size':>14}")
+
+        measure("shutil.make_archive", lambda: Path(
+            shutil.make_archive(tmp.joinpath("shutil").as_posix(), "zip", root_dir)
+        ))
+
+        for max_workers in sorted({1, os.cpu_count() or 1}):
+            out = tmp.joinpath(f"zip_utils_{max_workers}.zip")
+            measure(f"ZipUtils ({max_workers} workers)", lambda: (
+                ZipUtils.make_archive(root_dir, out, time.time(), max_workers=max_workers), out
+            )[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import json
+import threading
+import unittest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from sync.error import GraphQLError
+from sync.utils import GitHubGraphQLAPI, RateLimiter, Log
+
+
+class FakeGraphQLHandler(BaseHTTPRequestHandler):
+    server: "FakeGraphQLServer"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.count += 1
+
+        body = json.dumps(self.server.body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeGraphQLServer(ThreadingHTTPServer):
+    def __init__(self, body):
+        super().__init__(("127.0.0.1", 0), FakeGraphQLHandler)
+        self.body = body
+        self.count = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/graphql"
+
+
+class TestGitHubGraphQLAPI(unittest.TestCase):
+    def setUp(self):
+        Log.set_enable_stdout(False)
+
+        self._base_delay = RateLimiter._base_delay
+        RateLimiter._base_delay = 0.01
+        RateLimiter.set_max_retries(2)
+
+    def tearDown(self):
+        RateLimiter._base_delay = self._base_delay
+        RateLimiter.set_max_retries(5)
+
+    def create_api(self, body):
+        server = FakeGraphQLServer(body)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        api = GitHubGraphQLAPI(api_token="token")
+        api._api_url = server.url
+        return api, server
+
+    def test_errors_of_repositories(self):
+        api, _ = self.create_api({
+            "data": {"r0": {"name": "a"}, "r1": None, "r2": None},
+            "errors": [
+                {"type": "NOT_FOUND", "path": ["r1"], "message": "Could not resolve to a Repository"},
+                {"type": "FORBIDDEN", "path": ["r2"], "message": "Resource not accessible"}
+            ]
+        })
+
+        repositories = api.get_repositories("owner", ["a", "b", "c"])
+
+        self.assertEqual(repositories["a"].value, {"name": "a"})
+        self.assertTrue(repositories["b"].is_success)
+        self.assertIsNone(repositories["b"].value)
+        self.assertIsInstance(repositories["c"].error, GraphQLError)
+        self.assertIn("Resource not accessible", str(repositories["c"].error))
+
+    def test_rate_limited(self):
+        api, server = self.create_api({
+            "data": None,
+            "errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]
+        })
+
+        with self.assertRaises(GraphQLError):
+            api.get_repositories("owner", ["a"])
+
+        # the first request and 2 retries
+        self.assertEqual(server.count, 3)
+
+    def test_query_failed(self):
+        api, _ = self.create_api({
+            "data": None,
+            "errors": [{"type": "MAX_NODE_LIMIT_EXCEEDED", "message": "too many nodes"}]
+        })
+
+        with self.assertRaises(GraphQLError):
+            api.get_repositories("owner", ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
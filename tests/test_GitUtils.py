@@ -0,0 +1,73 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from git import Repo, GitCommandError
+
+from sync.utils import GitUtils
+
+
+class TestGitUtils(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+        self.source_dir = self.tmp.joinpath("source")
+        source = Repo.init(self.source_dir)
+        self.source_dir.joinpath("module.prop").write_text("id=test\n")
+        source.index.add(["module.prop"])
+        source.index.commit("init")
+        source.create_head("dev")
+
+        GitUtils.set_cache_folder(self.tmp.joinpath("cache"))
+        self.addCleanup(GitUtils.set_cache_folder, None)
+
+        self.url = self.source_dir.as_posix()
+
+    def test_keep_mirror_on_fetch_error(self):
+        mirror = GitUtils.fetch_mirror(self.url)
+        mirror_dir = Path(mirror.git_dir)
+
+        # the remote is unreachable for a while
+        self.source_dir.rename(self.tmp.joinpath("moved"))
+        with self.assertRaises(GitCommandError) as context:
+            GitUtils.fetch_mirror(self.url)
+
+        self.assertTrue(mirror_dir.exists())
+        self.assertNotEqual(context.exception.stderr, "")
+
+        self.tmp.joinpath("moved").rename(self.source_dir)
+        mirror = GitUtils.fetch_mirror(self.url)
+        self.assertEqual(GitUtils.read_file(mirror, "module.prop"), "id=test")
+
+    def test_recreate_corrupt_mirror(self):
+        mirror = GitUtils.fetch_mirror(self.url)
+        mirror_dir = Path(mirror.git_dir)
+        mirror_dir.joinpath("HEAD").unlink()
+
+        mirror = GitUtils.fetch_mirror(self.url)
+        self.assertEqual(GitUtils.read_file(mirror, "module.prop"), "id=test")
+
+    def test_remove_new_mirror_on_fetch_error(self):
+        url = self.tmp.joinpath("missing").as_posix()
+        with self.assertRaises(GitCommandError):
+            GitUtils.fetch_mirror(url)
+
+        self.assertFalse(GitUtils._get_mirror_dir(url, "full").exists())
+
+    def test_full_mirror_keeps_all_branches(self):
+        full = GitUtils.fetch_mirror(self.url, "full")
+        single = GitUtils.fetch_mirror(self.url, "single")
+
+        self.assertIn("origin/dev", [ref.name for ref in full.refs])
+        self.assertNotIn("origin/dev", [ref.name for ref in single.refs])
+        self.assertEqual(GitUtils.read_file(single, "module.prop"), "id=test")
+
+    def test_unknown_clone_strategy(self):
+        with self.assertRaises(ValueError):
+            GitUtils.fetch_mirror(self.url, "unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
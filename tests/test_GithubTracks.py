@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from sync.error import GraphQLError, Result
+from sync.track import GithubTracks
+from sync.utils import Log
+
+
+class TestGithubTracks(unittest.TestCase):
+    def setUp(self):
+        Log.set_enable_stdout(False)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        config = SimpleNamespace(enable_log=False, log_dir=None)
+        self.tracks = GithubTracks(Path(tmp.name), config, api_token="token")
+
+    def set_repos(self, *repos):
+        user = SimpleNamespace(get_repos=lambda: iter(repos))
+        self.tracks._github = SimpleNamespace(get_user=lambda _: user)
+
+    def test_skip_empty_repositories_after_grace_period(self):
+        now = datetime.now(timezone.utc)
+        self.set_repos(
+            SimpleNamespace(name="pushed", size=0, fork=False, archived=False, pushed_at=now),
+            SimpleNamespace(name="empty", size=0, fork=False, archived=False, pushed_at=now - timedelta(days=7)),
+            SimpleNamespace(name="module", size=10, fork=False, archived=False, pushed_at=now - timedelta(days=7))
+        )
+
+        names = list(self.tracks._get_repo_names("owner", True, True))
+        self.assertEqual(names, ["pushed", "module"])
+
+    def test_split_failed_batch(self):
+        queries = list()
+
+        def get_repositories(owner, names, *, shallow=False):
+            queries.append(names)
+            if "bad" in names:
+                raise GraphQLError("MAX_NODE_LIMIT_EXCEEDED: too many nodes")
+
+            return {name: Result(value={"name": name}) for name in names}
+
+        self.tracks._graphql_api.get_repositories = get_repositories
+        names = ["a", "b", "c", "bad", "d"]
+
+        repositories = self.tracks._query_repositories("owner", names, False)
+
+        self.assertEqual(list(repositories), ["a", "b", "c", "d"])
+        self.assertIn(["bad"], queries)
+        self.assertLessEqual(len(queries), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
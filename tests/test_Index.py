@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from sync.core import Config, Index, Sync
+from sync.model import TrackJson
+from sync.utils import Log
+
+
+def write_module_zip(file, module_id, version_code):
+    with zipfile.ZipFile(file, "w") as zf:
+        zf.writestr(
+            "module.prop",
+            f"id={module_id}\nname={module_id}\nversion=v{version_code}\n"
+            f"versionCode={version_code}\nauthor=test\ndescription=test\n"
+        )
+        zf.writestr("META-INF/com/google/android/update-binary", "#!/sbin/sh\n")
+        zf.writestr("META-INF/com/google/android/updater-script", "#MAGISK\n")
+
+
+class TestIndex(unittest.TestCase):
+    def setUp(self):
+        Log.set_enable_stdout(False)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root_folder = Path(tmp.name)
+
+        json_folder = Config.get_json_folder(self.root_folder)
+        json_folder.mkdir(parents=True)
+        json_folder.joinpath(Config.filename()).write_text(
+            json.dumps({"name": "test", "base_url": "https://example.com/", "enable_log": False})
+        )
+
+        local_folder = Config.get_local_folder(self.root_folder)
+        local_folder.mkdir(parents=True)
+        write_module_zip(local_folder.joinpath("m1.zip"), "m1", 1)
+        local_folder.joinpath("m1.md").write_text("# v1\n")
+
+        modules_folder = Config.get_modules_folder(self.root_folder)
+        self.track_json_file = modules_folder.joinpath("m1", TrackJson.filename())
+        self.track_json_file.parent.mkdir(parents=True)
+        TrackJson(id="m1", enable=True, update_to="m1.zip", license="", changelog="m1.md").write(self.track_json_file)
+
+        self.config = Config(self.root_folder)
+        sync = Sync(root_folder=self.root_folder, config=self.config)
+        sync.create_local_tracks()
+        sync.update(single=True)
+
+    def create_index(self, **kwargs):
+        index = Index(root_folder=self.root_folder, config=self.config)
+        index(version=1, to_file=True, single=True, **kwargs)
+        return index
+
+    def get_module(self, index, module_id):
+        return next(module for module in index.modules_json.modules if module.id == module_id)
+
+    def test_incremental_with_track_edited_outside_sync(self):
+        index = self.create_index()
+        self.assertEqual(self.get_module(index, "m1").track.license, "")
+
+        track = TrackJson.load(self.track_json_file)
+        track.license = "MIT"
+        track.write(self.track_json_file)
+
+        modules_json_file = Config.get_json_folder(self.root_folder).joinpath("modules.json")
+        last_modified = modules_json_file.stat().st_mtime
+        os.utime(self.track_json_file, (last_modified + 10, last_modified + 10))
+
+        # what 'sync --push --incremental' does when no module has been updated
+        index = self.create_index(incremental=True, module_ids=[])
+        self.assertEqual(self.get_module(index, "m1").track.license, "MIT")
+
+
+if __name__ == "__main__":
+    unittest.main()
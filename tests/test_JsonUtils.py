@@ -0,0 +1,37 @@
+import json
+import unittest
+
+from sync.utils import JsonUtils
+
+
+class TestJsonUtils(unittest.TestCase):
+    def test_trailing_commas(self):
+        text = '{"a": [1, 2, ], "b": {"c": 3, }, }'
+        self.assertEqual(JsonUtils.loads(text), {"a": [1, 2], "b": {"c": 3}})
+
+    def test_nested_trailing_commas(self):
+        text = '[[1, [2, ], ], {"a": {"b": [{}, ], }, }, ]'
+        self.assertEqual(JsonUtils.loads(text), [[1, [2]], {"a": {"b": [{}]}}])
+
+    def test_commas_inside_strings(self):
+        obj = {"a": "x, ]", "b": ["y,}", ", ] ,}"], "c": {"d": ",\n]"}}
+        text = json.dumps(obj)
+        self.assertEqual(JsonUtils.filter(text), text)
+        self.assertEqual(JsonUtils.loads(text[:-1] + ", }"), obj)
+
+    def test_escaped_quotes_inside_strings(self):
+        obj = {"a": 'say "hi", ]', "b": "\\", "c": '\\", }'}
+        text = json.dumps(obj)
+        self.assertEqual(JsonUtils.filter(text), text)
+        self.assertEqual(JsonUtils.loads(text.replace('"c"', '"e": [1, ], "c"')), {**obj, "e": [1]})
+
+    def test_bytes(self):
+        self.assertEqual(JsonUtils.loads('{"a": "é", }'.encode("utf-8")), {"a": "é"})
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            JsonUtils.loads('{"a": }')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from sync.model import LocalModule
+
+from test_Index import write_module_zip
+
+
+class TestLocalModule(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+        LocalModule.set_cache_folder(self.tmp.joinpath("cache"))
+        self.addCleanup(LocalModule.set_cache_folder, None)
+
+    def test_temporary_file_not_cached(self):
+        zip_file = self.tmp.joinpath("tmp.zip")
+        write_module_zip(zip_file, "m1", 1)
+
+        self.assertEqual(LocalModule.load(zip_file, use_cache=False).id, "m1")
+        self.assertEqual(LocalModule._cache.keys(), [])
+
+    def test_prune_cache(self):
+        kept = self.tmp.joinpath("m1.zip")
+        removed = self.tmp.joinpath("m2.zip")
+        write_module_zip(kept, "m1", 1)
+        write_module_zip(removed, "m2", 1)
+
+        LocalModule.load(kept)
+        LocalModule.load(removed)
+        removed.unlink()
+
+        LocalModule.prune_cache()
+        self.assertEqual(LocalModule._cache.keys(), [kept.resolve().as_posix()])
+
+
+if __name__ == "__main__":
+    unittest.main()
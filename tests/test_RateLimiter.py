@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+from sync.utils import RateLimiter
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    server: "FakeAPIServer"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, code, headers, body):
+        self.send_response(code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode("utf-8"))
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.count += 1
+            server.times.append(time.time())
+
+            # one secondary rate limit
+            if server.count == server.limited_at:
+                self._send(403, {"Retry-After": "1"}, {"message": "You have exceeded a secondary rate limit"})
+                return
+
+            now = time.time()
+            if now >= server.reset:
+                server.remaining = server.limit
+                server.reset = int(now) + server.window
+
+            headers = {
+                "X-RateLimit-Limit": str(server.limit),
+                "X-RateLimit-Reset": str(int(server.reset)),
+            }
+
+            if server.remaining <= 0:
+                headers["X-RateLimit-Remaining"] = "0"
+                server.rejected += 1
+                self._send(403, headers, {"message": "API rate limit exceeded"})
+                return
+
+            server.remaining -= 1
+            headers["X-RateLimit-Remaining"] = str(server.remaining)
+            self._send(200, headers, {"ok": True})
+
+
+class FakeAPIServer(ThreadingHTTPServer):
+    def __init__(self, limit, window, limited_at=None):
+        super().__init__(("127.0.0.1", 0), FakeAPIHandler)
+        self.lock = threading.Lock()
+        self.limit = limit
+        self.window = window
+        self.limited_at = limited_at
+        self.remaining = limit
+        self.reset = int(time.time()) + window
+        self.count = 0
+        self.rejected = 0
+        self.times = list()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+
+class TestRateLimiter(unittest.TestCase):
+    def start_server(self, **kwargs):
+        server = FakeAPIServer(**kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_retry_after_secondary_limit(self):
+        server = self.start_server(limit=100, window=60, limited_at=1)
+        limiter = RateLimiter("test")
+
+        start = time.time()
+        response = limiter.request(lambda: requests.get(server.url))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(server.count, 2)
+        self.assertGreaterEqual(time.time() - start, 1.0)
+        self.assertEqual(limiter.remaining, 99)
+
+    def test_wait_for_reset(self):
+        server = self.start_server(limit=3, window=2)
+        limiter = RateLimiter("test")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            responses = list(executor.map(
+                lambda _: limiter.request(lambda: requests.get(server.url)),
+                range(5)
+            ))
+
+        # the budget is exhausted after 3 requests, the rest wait for the next window
+        self.assertTrue(all(response.status_code == 200 for response in responses))
+        self.assertEqual(server.rejected, 0)
+        self.assertGreaterEqual(server.times[3] - server.times[2], 0.5)
+
+    def test_max_concurrency(self):
+        RateLimiter.set_max_concurrency(1)
+        self.addCleanup(RateLimiter.set_max_concurrency, 4)
+        limiter = RateLimiter("test")
+
+        active = list()
+        peak = list()
+        lock = threading.Lock()
+
+        class Response:
+            headers = dict()
+
+        def send():
+            with lock:
+                active.append(None)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return Response()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: limiter.request(send, lambda _: False), range(4)))
+
+        self.assertEqual(max(peak), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from sync.model import TrackJson
+
+
+class TestTrackJson(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+        TrackJson.set_cache_folder(self.tmp.joinpath("cache"))
+        self.addCleanup(TrackJson.set_cache_folder, None)
+
+    def test_cache_key_of_symlinked_folder(self):
+        json_file = self.tmp.joinpath("modules", "m1", TrackJson.filename())
+        json_file.parent.mkdir(parents=True)
+        TrackJson(id="m1", update_to="m1.zip").write(json_file)
+
+        link = self.tmp.joinpath("link")
+        link.symlink_to(self.tmp.joinpath("modules"), target_is_directory=True)
+
+        TrackJson.load(link.joinpath("m1", TrackJson.filename()))
+        self.assertEqual(TrackJson._cache.keys(), [json_file.resolve().as_posix()])
+
+        TrackJson.clear_cache(link.joinpath("m1", TrackJson.filename()))
+        self.assertEqual(TrackJson._cache.keys(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
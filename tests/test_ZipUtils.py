@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from zipfile import ZipFile
+
+from sync.utils import ZipUtils
+
+
+class TestZipUtils(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+        self.root_dir = self.tmp.joinpath("module")
+        self.root_dir.joinpath("system", "bin").mkdir(parents=True)
+        self.root_dir.joinpath("module.prop").write_text("id=test\n")
+        self.root_dir.joinpath("system", "bin", "large").write_bytes(os.urandom(1 << 16) * 8)
+
+        script = self.root_dir.joinpath("system", "bin", "script")
+        script.write_text("#!/system/bin/sh\n")
+        script.chmod(0o755)
+
+    def make_archive(self, name, **kwargs):
+        out = self.tmp.joinpath(name)
+        ZipUtils.make_archive(self.root_dir, out, 0, **kwargs)
+        return out
+
+    def patch(self, **kwargs):
+        for key, value in kwargs.items():
+            self.addCleanup(setattr, ZipUtils, key, getattr(ZipUtils, key))
+            setattr(ZipUtils, key, value)
+
+    def assertArchive(self, file):
+        self.assertIsNone(ZipUtils.test_archive(file))
+        with ZipFile(file, "r") as zipfile:
+            self.assertEqual(
+                zipfile.namelist(),
+                ["module.prop", "system/", "system/bin/", "system/bin/large", "system/bin/script"]
+            )
+            self.assertEqual(zipfile.read("module.prop"), b"id=test\n")
+            self.assertEqual(zipfile.getinfo("system/bin/script").external_attr >> 16, 0o100755)
+
+    def test_deterministic(self):
+        first = self.make_archive("first.zip", max_workers=1)
+        second = self.make_archive("second.zip", max_workers=4)
+
+        self.assertArchive(first)
+        self.assertEqual(first.read_bytes(), second.read_bytes())
+
+    def test_stream_large_files(self):
+        buffered = self.make_archive("buffered.zip")
+
+        self.patch(_stream_size=1 << 16, _chunk_size=1 << 12)
+        streamed = self.make_archive("streamed.zip")
+
+        self.assertArchive(streamed)
+        self.assertEqual(buffered.read_bytes(), streamed.read_bytes())
+
+    def test_zip64(self):
+        # lower the limits, so that every zip64 record is written without gigabytes of data
+        self.patch(_max_value=1 << 16, _max_count=2, _stream_size=1 << 16)
+        out = self.make_archive("zip64.zip")
+
+        self.assertArchive(out)
+        with ZipFile(out, "r") as zipfile:
+            self.assertEqual(zipfile.getinfo("system/bin/large").file_size, 1 << 19)
+            self.assertGreaterEqual(zipfile.getinfo("system/bin/script").header_offset, 1 << 16)
+
+
+if __name__ == "__main__":
+    unittest.main()